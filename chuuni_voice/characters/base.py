@@ -18,7 +18,10 @@ Audio files are the sole data source for playback.  Any file whose name
 ends with ``_<event_name>.mp3`` (or ``.wav``) is a candidate for that event.
 """
 
+import functools
+import os
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -29,12 +32,35 @@ else:
     import tomli as tomllib  # type: ignore[no-redef]
 
 
+@functools.lru_cache(maxsize=64)
+def _toml_present(toml_path_str: str, dir_mtime_ns: int) -> bool:
+    """Whether *toml_path_str* exists, memoized on its parent dir's mtime.
+
+    Characters that never ship a character.toml (users who only drop audio
+    files) would otherwise pay a stat on every load; creating or deleting
+    the toml bumps the directory mtime and invalidates the entry.
+    """
+    return os.path.isfile(toml_path_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_toml_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse *path_str* as TOML, memoized on (path, mtime).
+
+    The mtime key means edits invalidate naturally while repeated loads of an
+    unchanged file (status, character list, every hook fire) parse only once
+    per process.
+    """
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
 # ---------------------------------------------------------------------------
 # Character dataclass
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """Represents an installed chuuni-voice character."""
 
@@ -65,29 +91,64 @@ class CharacterManager:
         unreadable.
         """
         char_path = Path(path)
-        toml_file = char_path / "character.toml"
+        name_fallback = char_path.name
+        audio_dir_str = str(char_path)
+        toml_file = str(char_path / "character.toml")
+
+        try:
+            dir_mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            dir_mtime_ns = -1
 
-        if not toml_file.exists():
+        if not _toml_present(toml_file, dir_mtime_ns):
             return Character(
-                name=char_path.name,
-                display_name=char_path.name,
+                name=name_fallback,
+                display_name=name_fallback,
                 description="",
-                audio_dir=str(char_path),
+                audio_dir=audio_dir_str,
             )
 
-        with toml_file.open("rb") as f:
-            data: dict[str, Any] = tomllib.load(f)
+        data: dict[str, Any] = _load_toml_cached(
+            toml_file, os.stat(toml_file).st_mtime_ns
+        )
 
         meta = data.get("character", {})
 
         return Character(
-            name=meta.get("name", char_path.name),
-            display_name=meta.get("display_name", char_path.name),
+            name=meta.get("name", name_fallback),
+            display_name=meta.get("display_name", name_fallback),
             description=meta.get("description", ""),
-            audio_dir=str(char_path),
+            audio_dir=audio_dir_str,
             rvc_model=meta.get("rvc_model", ""),
         )
 
+    @staticmethod
+    def _scan_character_paths(base_dir: str) -> list[str]:
+        """Return sorted paths of the immediate subdirectories of *base_dir*."""
+        try:
+            with os.scandir(base_dir) as it:
+                # DirEntry.is_dir reuses the dirent type from the scandir
+                # call, so no extra stat per child.  Sorting the bare path
+                # strings (same order as by name — shared prefix) avoids a
+                # key callable per comparison.
+                return sorted(e.path for e in it if e.is_dir(follow_symlinks=False))
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    @staticmethod
+    def iter_characters(base_dir: str) -> Iterator[Character]:
+        """Yield characters under *base_dir* lazily, in directory-name order.
+
+        Each toml is parsed only when its character is consumed, so callers
+        that print as they go see first output before the whole set loads.
+        Unreadable directories are silently skipped.
+        """
+        for subpath in CharacterManager._scan_character_paths(base_dir):
+            try:
+                yield CharacterManager.load_from_dir(subpath)
+            except Exception:
+                pass
+
     @staticmethod
     def list_characters(base_dir: str) -> list[Character]:
         """Return all characters installed under *base_dir*.
@@ -95,19 +156,26 @@ class CharacterManager:
         Each immediate subdirectory is treated as a character.
         Unreadable directories are silently skipped.
         """
-        base = Path(base_dir)
-        if not base.is_dir():
-            return []
+        paths = CharacterManager._scan_character_paths(base_dir)
+
+        # Small installs load inline; larger ones overlap the per-character
+        # file I/O (stat + toml read) with a small thread pool.  ex.map
+        # preserves the sorted order.
+        if len(paths) <= 2:
+            return list(CharacterManager.iter_characters(base_dir))
 
-        characters: list[Character] = []
-        for subdir in sorted(base.iterdir()):
-            if not subdir.is_dir():
-                continue
+        def _safe_load(subpath: str) -> Character | None:
             try:
-                characters.append(CharacterManager.load_from_dir(str(subdir)))
+                return CharacterManager.load_from_dir(subpath)
             except Exception:
-                pass
-        return characters
+                return None
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            loaded = list(ex.map(_safe_load, paths))
+
+        return [c for c in loaded if c is not None]
 
 
 # ---------------------------------------------------------------------------
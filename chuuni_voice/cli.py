@@ -1,10 +1,15 @@
-import json
-import platform
-import shutil
+import functools
+import os
+import random
+import re
 import sys
-import time
 from pathlib import Path
 
+try:  # optional dependency — stdlib json is the fallback
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
 import click
 
 from chuuni_voice import __version__
@@ -12,7 +17,24 @@ from chuuni_voice.events import ChuuniEvent, get_line
 
 AUDIO_EXTENSIONS = [".mp3", ".wav", ".ogg", ".aiff"]
 
-_EVENT_NAMES = "  ".join(e.value for e in ChuuniEvent)
+# Precomputed at import for the _resolve_all_audio hot loop: a tuple makes
+# str.endswith a single C-level multi-suffix check, and the per-event
+# "_<event>" fragments avoid re-building f-strings per directory entry.
+_AUDIO_EXT_TUPLE = tuple(AUDIO_EXTENSIONS)
+_EVENT_SUFFIXES = {e.value: f"_{e.value}" for e in ChuuniEvent}
+
+# value → enum table: dict lookup on the valid path beats exception-driven
+# ChuuniEvent(...) dispatch, and the joined strings are built once.
+_EVENT_BY_VALUE = {e.value: e for e in ChuuniEvent}
+_EVENT_VALUES_JOINED = ", ".join(_EVENT_BY_VALUE)
+_EVENT_NAMES = "  ".join(_EVENT_BY_VALUE)
+
+# Constant styled fragments for status() — rendered once instead of
+# rebuilding the same ANSI sequences on every echo.
+_OK = click.style("✓", fg="green")
+_NG = click.style("✗", fg="red")
+_NOT_FOUND = click.style("(not found)", fg="yellow")
+_NOT_CONFIGURED = click.style("(not configured)", fg="yellow")
 
 
 # ---------------------------------------------------------------------------
@@ -169,15 +191,14 @@ def play(event: str) -> None:
 
     Prints the Japanese line even when no audio file is found.
     """
-    from chuuni_voice.config import load_config, get_character_dir
-    from chuuni_voice.player import _check_and_claim_cooldown, _play_blocking
+    from chuuni_voice.config import resolved_config
     from chuuni_voice import daemon as _daemon
 
     _debug_log(f"play called: event={event}")
 
-    cfg = load_config()
+    cfg = resolved_config()
 
-    if not cfg.get("enabled", True):
+    if not cfg.enabled:
         click.echo(
             click.style("chuuni-voice is disabled", fg="yellow")
             + " — set enabled = true in config to re-enable.",
@@ -185,23 +206,22 @@ def play(event: str) -> None:
         )
         sys.exit(1)
 
-    try:
-        chuuni_event = ChuuniEvent(event.lower())
-    except ValueError:
-        valid = ", ".join(e.value for e in ChuuniEvent)
-        click.echo(f"Unknown event {event!r}.\nValid events: {valid}", err=True)
+    chuuni_event = _EVENT_BY_VALUE.get(event.lower())
+    if chuuni_event is None:
+        click.echo(
+            f"Unknown event {event!r}.\nValid events: {_EVENT_VALUES_JOINED}", err=True
+        )
         sys.exit(1)
 
-    char_dir = get_character_dir(cfg)
-    volume = float(cfg.get("volume", 0.8))
+    char_dir = cfg.character_dir
+    volume = cfg.volume
     audio_path = _resolve_audio(char_dir, chuuni_event.value)
 
-    _debug_log(f"  enabled={cfg.get('enabled')}, audio_path={audio_path}, volume={volume}")
+    _debug_log(f"  enabled={cfg.enabled}, audio_path={audio_path}, volume={volume}")
 
     # ── Daemon path ──────────────────────────────────────────────────────────
-    # Auto-start the daemon if it isn't running yet.
-    daemon_up = _ensure_daemon_running()
-    _debug_log(f"  daemon_up={daemon_up}")
+    # Optimistically send first: when the daemon is already up (the steady
+    # state) this is one socket round-trip instead of probe + send.
     # send_play() returns None only when the daemon is not running (connection
     # error / no socket).  A cooldown rejection returns {"ok": false} — still
     # a valid response, so we exit here in both the accepted and rejected cases.
@@ -210,17 +230,29 @@ def play(event: str) -> None:
         str(audio_path) if audio_path else "",
         volume,
     )
+    if resp is None and _ensure_daemon_running():
+        # Daemon wasn't up — it is now; retry once.
+        resp = _daemon.send_play(
+            chuuni_event.value,
+            str(audio_path) if audio_path else "",
+            volume,
+        )
     _debug_log(f"  daemon resp={resp}")
     if resp is not None:
         if resp.get("ok"):
-            click.echo(f"[{chuuni_event.value}]  {_character_line(chuuni_event, str(char_dir))}")
+            # Plain write: the hot accepted path emits one unstyled line, so
+            # skip click.echo's per-call color/newline handling.
+            sys.stdout.write(
+                f"[{chuuni_event.value}]  {_character_line(chuuni_event, str(char_dir))}\n"
+            )
         return  # daemon handled it (or cooldown dropped it)
 
     # ── Fallback: direct playback with file-based cooldown ───────────────────
+    # The player module is only needed here — the daemon path above returns
+    # without touching audio code.
     _debug_log("  daemon unreachable, using fallback")
-    from chuuni_voice.config import get_cooldowns
-    cooldowns = get_cooldowns(cfg)
-    cooldown = cooldowns.get(chuuni_event.value, float(cfg.get("cooldown_seconds", 5.0)))
+    from chuuni_voice.player import _check_and_claim_cooldown
+    cooldown = cfg.cooldowns.get(chuuni_event.value, cfg.default_cooldown)
     if not _check_and_claim_cooldown(chuuni_event.value, cooldown):
         _debug_log(f"  fallback cooldown blocked (cd={cooldown}s)")
         return  # silently skip — within cooldown window
@@ -237,6 +269,7 @@ def play(event: str) -> None:
         return
 
     click.echo(click.style(f"  ♪  {audio_path.name}", fg="cyan"))
+    from chuuni_voice.player import _play_blocking
     _play_blocking(str(audio_path), volume)
 
 
@@ -249,17 +282,25 @@ def play(event: str) -> None:
 @click.argument("hook_ctx", metavar="CTX")
 def on_hook(hook_ctx: str) -> None:
     """Internal dispatcher: reads Claude Code hook JSON from stdin and plays."""
-    from chuuni_voice.config import load_config, get_character_dir
-    from chuuni_voice.player import _check_and_claim_cooldown, _play_blocking
+    from chuuni_voice.config import resolved_config
     from chuuni_voice import daemon as _daemon
 
-    cfg = load_config()
-    if not cfg.get("enabled", True):
+    cfg = resolved_config()
+    if not cfg.enabled:
         return
 
     try:
-        raw = sys.stdin.read()
-        data: dict = json.loads(raw) if raw.strip() else {}
+        # Read raw bytes straight off the stdin fd — skips the io buffer
+        # machinery entirely — and let the parser decode: orjson takes bytes
+        # natively, and stdlib json accepts them too.
+        chunks = []
+        while True:
+            b = os.read(0, 65536)
+            if not b:
+                break
+            chunks.append(b)
+        raw = b"".join(chunks)
+        data: dict = _json.loads(raw) if raw.strip() else {}
     except Exception:
         data = {}
 
@@ -267,8 +308,8 @@ def on_hook(hook_ctx: str) -> None:
     if event is None:
         return
 
-    char_dir = get_character_dir(cfg)
-    volume = float(cfg.get("volume", 0.8))
+    char_dir = cfg.character_dir
+    volume = cfg.volume
     audio_path = _resolve_audio(char_dir, event.value)
 
     # ── Daemon path ──────────────────────────────────────────────────────────
@@ -279,18 +320,20 @@ def on_hook(hook_ctx: str) -> None:
     )
     if resp is not None:
         if resp.get("ok"):
-            click.echo(f"[{event.value}]  {_character_line(event, str(char_dir))}")
+            sys.stdout.write(
+                f"[{event.value}]  {_character_line(event, str(char_dir))}\n"
+            )
         return  # daemon handled it
 
     # ── Fallback: file-based cooldown + direct playback ──────────────────────
-    from chuuni_voice.config import get_cooldowns
-    cooldowns = get_cooldowns(cfg)
-    cooldown = cooldowns.get(event.value, float(cfg.get("cooldown_seconds", 5.0)))
+    from chuuni_voice.player import _check_and_claim_cooldown
+    cooldown = cfg.cooldowns.get(event.value, cfg.default_cooldown)
     if not _check_and_claim_cooldown(event.value, cooldown):
         return
 
     click.echo(f"[{event.value}]  {_character_line(event, str(char_dir))}")
     if audio_path:
+        from chuuni_voice.player import _play_blocking
         _play_blocking(str(audio_path), volume)
 
 
@@ -316,19 +359,22 @@ def character_list() -> None:
     click.echo(f"── Characters  (base: {CHARACTERS_DIR}) ────────────────────")
     click.echo()
 
-    chars = CharacterManager.list_characters(str(CHARACTERS_DIR))
-    if not chars:
-        click.echo("  No characters found.")
-        click.echo(f"  Create a directory under {CHARACTERS_DIR}/ to add one.")
-        return
-
-    for char in chars:
+    # Stream rows as characters load so first output isn't gated on parsing
+    # every character.toml up front.
+    shown = 0
+    for char in CharacterManager.iter_characters(str(CHARACTERS_DIR)):
+        shown += 1
         marker = click.style("*", fg="green", bold=True) if char.name == active else " "
         name_col = click.style(char.name, bold=(char.name == active))
         disp = char.display_name if char.display_name != char.name else ""
         desc = char.description or "(no description)"
         click.echo(f"  {marker} {name_col:<20}  {disp:<12}  {desc}")
 
+    if not shown:
+        click.echo("  No characters found.")
+        click.echo(f"  Create a directory under {CHARACTERS_DIR}/ to add one.")
+        return
+
     click.echo()
     click.echo(f"  Active: {click.style(active, fg='green', bold=True)}")
 
@@ -388,12 +434,10 @@ def daemon_start() -> None:
             stderr=lf,
         )
 
-    # Poll up to 2 s for the daemon to become ready
-    for _ in range(20):
-        time.sleep(0.1)
-        if _daemon.is_running():
-            click.echo(f"daemon: started  (pid={proc.pid})")
-            return
+    # Wait up to 2 s for the daemon to become ready
+    if _daemon.wait_running(True, timeout=2.0):
+        click.echo(f"daemon: started  (pid={proc.pid})")
+        return
 
     click.echo(
         f"daemon: spawned (pid={proc.pid}) — check {_daemon.LOG_FILE} if it doesn't respond",
@@ -420,11 +464,7 @@ def daemon_stop() -> None:
     # the server socket due to the accept() timeout.  Without this wait,
     # a back-to-back "daemon stop && daemon start" would see is_running()=True
     # and refuse to start.
-    deadline = time.time() + 3.0
-    while time.time() < deadline:
-        if not _daemon.is_running():
-            break
-        time.sleep(0.05)
+    _daemon.wait_running(False, timeout=3.0)
 
     click.echo("daemon: stopped")
 
@@ -450,21 +490,37 @@ def daemon_status() -> None:
 def daemon_run() -> None:
     """Internal: run the audio daemon in the foreground (called by 'daemon start')."""
     import logging as _logging
+    import logging.handlers as _handlers
+    import queue as _queue
     from chuuni_voice import daemon as _daemon
     from chuuni_voice.config import load_config
 
     _daemon.CHUUNI_DIR.mkdir(parents=True, exist_ok=True)
-    _logging.basicConfig(
-        filename=str(_daemon.LOG_FILE),
-        level=_logging.DEBUG,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+
+    # Log through a queue: connection threads just enqueue records (no
+    # formatting, no shared file lock) and a listener thread does the
+    # formatting + file I/O off the hot path.
+    log_queue: _queue.SimpleQueue = _queue.SimpleQueue()
+    file_handler = _logging.FileHandler(str(_daemon.LOG_FILE))
+    file_handler.setFormatter(
+        _logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
     )
+    root = _logging.getLogger()
+    root.setLevel(_logging.DEBUG)
+    root.addHandler(_handlers.QueueHandler(log_queue))
+    listener = _handlers.QueueListener(log_queue, file_handler)
+    listener.start()
 
     from chuuni_voice.config import get_cooldowns
     cfg = load_config()
     cooldowns = get_cooldowns(cfg)
     default_cooldown = float(cfg.get("cooldown_seconds", 5.0))
-    _daemon.AudioDaemon(cooldowns=cooldowns, default_cooldown=default_cooldown).run()
+    try:
+        _daemon.AudioDaemon(
+            cooldowns=cooldowns, default_cooldown=default_cooldown
+        ).run()
+    finally:
+        listener.stop()
 
 
 # ---------------------------------------------------------------------------
@@ -475,12 +531,10 @@ def daemon_run() -> None:
 @main.command()
 def status() -> None:
     """Show current config and component status at a glance."""
-    from chuuni_voice.characters.base import CharacterManager
     from chuuni_voice.config import load_config, CONFIG_FILE, get_character_dir
 
     cfg = load_config()
-    ok = click.style("✓", fg="green")
-    ng = click.style("✗", fg="red")
+    ok, ng = _OK, _NG
 
     # ── Config ──────────────────────────────────────────────────────────────
     click.echo("── Config ──────────────────────────────────────────────")
@@ -501,7 +555,7 @@ def status() -> None:
     click.echo(f"  Directory   {dir_sym}  {char_dir}")
 
     try:
-        char = CharacterManager.load_from_dir(str(char_dir))
+        char = _load_active_character(str(char_dir))
         if char.display_name and char.display_name != char.name:
             click.echo(f"  Display     {char.display_name}")
         if char.description:
@@ -511,12 +565,13 @@ def status() -> None:
 
     click.echo()
     click.echo("  Audio files:")
+    audio_map = _resolve_all_audio(char_dir)
     for event in ChuuniEvent:
-        path = _resolve_audio(char_dir, event.value)
-        if path:
-            click.echo(f"    {ok}  {event.value:<14}  {path.name}")
+        candidates = audio_map[event.value]
+        if candidates:
+            click.echo(f"    {ok}  {event.value:<14}  {os.path.basename(candidates[0])}")
         else:
-            click.echo(f"    {ng}  {event.value:<14}  {click.style('(not found)', fg='yellow')}")
+            click.echo(f"    {ng}  {event.value:<14}  {_NOT_FOUND}")
 
     # ── RVC ─────────────────────────────────────────────────────────────────
     click.echo()
@@ -524,21 +579,25 @@ def status() -> None:
     model_path = cfg.get("rvc_model_path", "")
     index_path = cfg.get("rvc_index_path", "")
     if model_path:
-        click.echo(f"  Model  {ok if Path(model_path).expanduser().exists() else ng}  {model_path}")
+        model_sym = ok if os.path.exists(os.path.expanduser(model_path)) else ng
+        click.echo(f"  Model  {model_sym}  {model_path}")
     else:
-        click.echo(f"  Model      {click.style('(not configured)', fg='yellow')}")
+        click.echo(f"  Model      {_NOT_CONFIGURED}")
     if index_path:
-        click.echo(f"  Index  {ok if Path(index_path).expanduser().exists() else ng}  {index_path}")
+        index_sym = ok if os.path.exists(os.path.expanduser(index_path)) else ng
+        click.echo(f"  Index  {index_sym}  {index_path}")
     else:
-        click.echo(f"  Index      {click.style('(not configured)', fg='yellow')}")
+        click.echo(f"  Index      {_NOT_CONFIGURED}")
 
     # ── Player ───────────────────────────────────────────────────────────────
     click.echo()
     click.echo("── Player ──────────────────────────────────────────────")
+    import platform
+
     system = platform.system()
     bins = ["afplay"] if system == "Darwin" else ["aplay", "mpg123"]
     for b in bins:
-        found = shutil.which(b)
+        found = _which(b)
         sym = ok if found else ng
         loc = found or click.style("not found in PATH", fg="red")
         click.echo(f"  {sym}  {b:<10}  {loc}")
@@ -572,11 +631,33 @@ def status() -> None:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-_DEBUG_LOG = Path.home() / ".config" / "chuuni" / "debug.log"
+_DEBUG_LOG = Path(
+    os.environ.get("HOME") or os.path.expanduser("~"),
+    ".config",
+    "chuuni",
+    "debug.log",
+)
+
+# Debug logging is opt-in: without CHUUNI_DEBUG set, every hook fire would
+# otherwise pay a mkdir + open + write + close just for trace lines.
+_DEBUG_ENABLED = bool(os.environ.get("CHUUNI_DEBUG"))
+
+
+@functools.cache
+def _which(name: str) -> str | None:
+    """shutil.which, memoized — binary locations don't change mid-process."""
+    import shutil
+
+    return shutil.which(name)
 
 
 def _debug_log(msg: str) -> None:
-    """Append a timestamped line to ~/.config/chuuni/debug.log."""
+    """Append a timestamped line to ~/.config/chuuni/debug.log.
+
+    No-op unless the CHUUNI_DEBUG environment variable is set.
+    """
+    if not _DEBUG_ENABLED:
+        return
     try:
         from datetime import datetime
         _DEBUG_LOG.parent.mkdir(parents=True, exist_ok=True)
@@ -589,6 +670,7 @@ def _debug_log(msg: str) -> None:
 def _ensure_daemon_running() -> bool:
     """Start the daemon if it isn't running. Return True if daemon is up."""
     import subprocess as _subprocess
+
     from chuuni_voice import daemon as _daemon
 
     if _daemon.is_running():
@@ -604,45 +686,115 @@ def _ensure_daemon_running() -> bool:
             stderr=lf,
         )
 
-    for _ in range(20):
-        time.sleep(0.1)
-        if _daemon.is_running():
-            return True
-
-    return False
+    return _daemon.wait_running(True, timeout=2.0)
 
 
 def _chuuni_bin() -> str:
     """Return the absolute path to the chuuni binary.
 
     Search order:
-      1. shutil.which("chuuni")                — works when chuuni is on PATH
+      1. Path(sys.argv[0]).resolve()            — we usually *are* chuuni
       2. Path(sys.executable).parent / "chuuni" — same venv as running Python
-      3. bare "chuuni"                          — last resort
+      3. shutil.which("chuuni")                 — PATH scan, last real resort
+      4. bare "chuuni"
     """
-    found = shutil.which("chuuni")
-    if found:
-        return found
+    try:
+        argv0 = Path(sys.argv[0]).resolve()
+        if argv0.name.startswith("chuuni") and argv0.is_file():
+            return str(argv0)
+    except OSError:
+        pass
     candidate = Path(sys.executable).parent / "chuuni"
     if candidate.exists():
         return str(candidate)
+    found = _which("chuuni")
+    if found:
+        return found
     return "chuuni"
 
 
+# Last loaded Character, keyed on (directory, character.toml mtime_ns).
+# Avoids re-reading the toml when the same character is resolved repeatedly
+# within one process; -1 stands for "no toml present".
+_active_char_cache: tuple[str, int, object] | None = None
+
+
+def _load_active_character(char_dir: str):
+    """Return the Character for *char_dir*, cached on the toml's mtime."""
+    global _active_char_cache
+
+    try:
+        mtime = os.stat(os.path.join(char_dir, "character.toml")).st_mtime_ns
+    except OSError:
+        mtime = -1
+
+    cached = _active_char_cache
+    if cached is not None and cached[0] == char_dir and cached[1] == mtime:
+        return cached[2]
+
+    from chuuni_voice.characters.base import CharacterManager
+
+    char = CharacterManager.load_from_dir(char_dir)
+    _active_char_cache = (char_dir, mtime, char)
+    return char
+
+
+def _resolve_all_audio(character_dir: Path) -> dict[str, list[str]]:
+    """Classify every audio file in *character_dir* by event in one pass.
+
+    A single ``os.scandir`` replaces the per-event glob+exists probes: each
+    entry is matched against ``_<event>.<ext>`` / ``<event>.<ext>`` for all
+    events at once, so resolving the full event table is O(dir size) instead
+    of O(events × dir size).
+
+    Buckets hold plain path strings — callers wrap the single winning entry
+    in ``Path`` instead of paying a Path allocation per candidate.
+    """
+    buckets: dict[str, list[str]] = {e.value: [] for e in ChuuniEvent}
+    try:
+        it = os.scandir(character_dir)
+    except OSError:
+        return buckets
+
+    with it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(_AUDIO_EXT_TUPLE):
+                continue
+            file_stem = name[: name.rfind(".")]
+            for stem, bucket in buckets.items():
+                if file_stem == stem or file_stem.endswith(_EVENT_SUFFIXES[stem]):
+                    bucket.append(entry.path)
+                    break
+    return buckets
+
+
+@functools.lru_cache(maxsize=8)
+def _index_character_dir(char_dir_str: str, dir_mtime_ns: int) -> dict[str, tuple[str, ...]]:
+    """Event → audio-candidates index for one character directory.
+
+    Keyed on the directory's mtime_ns so dropping in a new clip invalidates
+    the entry; while nothing changes, repeated resolution is a dict lookup
+    instead of a directory scan.
+    """
+    return {
+        stem: tuple(paths)
+        for stem, paths in _resolve_all_audio(Path(char_dir_str)).items()
+    }
+
+
 def _resolve_audio(character_dir: Path, stem: str) -> Path | None:
     """Return a random audio file for *stem* in *character_dir*.
 
     Matches any file ending with ``_<stem>.<ext>`` or the bare ``<stem>.<ext>``.
     """
-    import random as _random
+    try:
+        dir_mtime_ns = os.stat(character_dir).st_mtime_ns
+    except OSError:
+        return None
 
-    candidates: list[Path] = []
-    for ext in AUDIO_EXTENSIONS:
-        candidates.extend(sorted(character_dir.glob(f"*_{stem}{ext}")))
-        exact = character_dir / f"{stem}{ext}"
-        if exact.exists() and exact not in candidates:
-            candidates.append(exact)
-    return _random.choice(candidates) if candidates else None
+    candidates = _index_character_dir(str(character_dir), dir_mtime_ns).get(stem)
+    return Path(random.choice(candidates)) if candidates else None
 
 
 def _character_line(event: ChuuniEvent, char_dir: str) -> str:
@@ -662,26 +814,40 @@ _CRASH_KEYWORDS = (
     "NameError",
 )
 
+# Compiled once: a literal alternation scans the (possibly multi-KB) tool
+# output in a single C-level pass instead of one substring search per keyword.
+_CRASH_RE = re.compile("|".join(map(re.escape, _CRASH_KEYWORDS)))
 
-def _dispatch(hook_ctx: str, data: dict) -> ChuuniEvent | None:
-    if hook_ctx == "post-bash":
-        exit_code = (
-            data.get("tool_response", {}).get("exit_code")
-            or data.get("exit_code")
-            or 0
-        )
-        if exit_code == 0:
-            return ChuuniEvent.TEST_PASS
-
-        # Non-zero exit: check output for crash signatures before defaulting to
-        # test_fail.  error > test_fail so runtime crashes get their own sound.
-        output: str = (
-            data.get("tool_response", {}).get("output", "")
-            or data.get("output", "")
-            or ""
-        )
-        if any(kw in output for kw in _CRASH_KEYWORDS):
-            return ChuuniEvent.ERROR
 
-        return ChuuniEvent.TEST_FAIL
-    return None
+def _dispatch_post_bash(data: dict) -> ChuuniEvent | None:
+    exit_code = (
+        data.get("tool_response", {}).get("exit_code")
+        or data.get("exit_code")
+        or 0
+    )
+    if exit_code == 0:
+        return ChuuniEvent.TEST_PASS
+
+    # Non-zero exit: check output for crash signatures before defaulting to
+    # test_fail.  error > test_fail so runtime crashes get their own sound.
+    output: str = (
+        data.get("tool_response", {}).get("output", "")
+        or data.get("output", "")
+        or ""
+    )
+    if _CRASH_RE.search(output):
+        return ChuuniEvent.ERROR
+
+    return ChuuniEvent.TEST_FAIL
+
+
+# Hook context → handler.  Table dispatch keeps _dispatch O(1) as contexts
+# are added instead of growing an elif chain.
+_DISPATCHERS = {
+    "post-bash": _dispatch_post_bash,
+}
+
+
+def _dispatch(hook_ctx: str, data: dict) -> ChuuniEvent | None:
+    handler = _DISPATCHERS.get(hook_ctx)
+    return handler(data) if handler is not None else None
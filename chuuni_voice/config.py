@@ -1,4 +1,7 @@
+import logging
+import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -7,10 +10,21 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib  # type: ignore[no-redef]
 
-import tomli_w
+# Resolved once: $HOME when set (the normal case — one env lookup), falling
+# back to expanduser for exotic environments.  The multi-segment Path(...)
+# constructor builds each constant in one allocation instead of a `/` chain
+# of intermediates.
+_HOME = os.environ.get("HOME") or os.path.expanduser("~")
 
-CONFIG_DIR = Path.home() / ".config" / "chuuni"
+log = logging.getLogger(__name__)
+
+CONFIG_DIR = Path(_HOME, ".config", "chuuni")
 CONFIG_FILE = CONFIG_DIR / "config.toml"
+# Pickled on-disk config, written alongside the TOML by save_config.  Unpickling
+# ~8 scalar keys is an order of magnitude cheaper than a TOML parse, so cold
+# processes (every hook fire is a fresh process) skip tomllib when the sidecar
+# is at least as new as the TOML.
+CONFIG_CACHE_FILE = CONFIG_DIR / "config.cache"
 CHARACTERS_DIR = CONFIG_DIR / "characters"
 
 DEFAULT_CONFIG: dict[str, Any] = {
@@ -51,25 +65,212 @@ def get_cooldowns(cfg: dict[str, Any]) -> dict[str, float]:
     return merged
 
 
+# Parsed-config cache: (st_mtime_ns, st_size) of config.toml → merged dict.
+# Every CLI entry and hook fire calls load_config; the file rarely changes,
+# so warm calls skip the TOML parse entirely.
+_CONFIG_CACHE: tuple[tuple[int, int], dict[str, Any]] | None = None
+
+
+def _invalidate_cache() -> None:
+    global _CONFIG_CACHE, _RESOLVED_CACHE
+    _CONFIG_CACHE = None
+    _RESOLVED_CACHE = None
+
+
 def load_config() -> dict[str, Any]:
     """Load config from disk, merging missing keys with defaults.
 
-    Returns a flat dict with all keys guaranteed to be present.
+    Returns a flat dict with all keys guaranteed to be present.  Warm calls
+    are served from an in-memory cache keyed on the file's (mtime, size);
+    callers get a shallow copy so local mutation can't poison the cache.
     """
-    if not CONFIG_FILE.exists():
+    global _CONFIG_CACHE
+
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
         return dict(DEFAULT_CONFIG)
-    with CONFIG_FILE.open("rb") as f:
-        on_disk = tomllib.load(f)
-    merged = dict(DEFAULT_CONFIG)
-    merged.update(on_disk)
-    return merged
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+
+    merged = _load_pickle_sidecar(st.st_mtime_ns)
+    if merged is None:
+        with CONFIG_FILE.open("rb") as f:
+            on_disk = tomllib.load(f)
+        merged = dict(DEFAULT_CONFIG)
+        merged.update(on_disk)
+    _CONFIG_CACHE = (key, merged)
+    return dict(merged)
+
+
+def _load_pickle_sidecar(toml_mtime_ns: int) -> dict[str, Any] | None:
+    """Return the defaults-merged config from the pickle sidecar.
+
+    The sidecar holds only the keys that were written to the TOML, so
+    DEFAULT_CONFIG is merged underneath here — same as the tomllib branch.
+    A sidecar that baked in the defaults would drop keys added to
+    DEFAULT_CONFIG by an upgrade and freeze old default values.
+
+    Returns None (falling back to the TOML parse) when the sidecar is missing,
+    stale — e.g. the user hand-edited config.toml — or unreadable.
+    """
+    import pickle
+
+    try:
+        if os.stat(CONFIG_CACHE_FILE).st_mtime_ns < toml_mtime_ns:
+            return None
+        with CONFIG_CACHE_FILE.open("rb") as f:
+            on_disk = pickle.load(f)
+        if not isinstance(on_disk, dict):
+            return None
+        merged = dict(DEFAULT_CONFIG)
+        merged.update(on_disk)
+        return merged
+    except Exception:
+        return None
+
+
+def _toml_repr(value: Any) -> str:
+    """TOML literal for the value types tomllib can hand back to us.
+
+    Covers the flat scalars the schema uses plus arrays and date/time
+    values, since load_config preserves unknown keys from hand-edited
+    files and they must survive a save round-trip.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_toml_repr(v) for v in value) + "]"
+    import datetime
+
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"unsupported config value type: {type(value).__name__}")
 
 
 def save_config(config: dict[str, Any]) -> None:
-    """Persist *config* to ~/.config/chuuni/config.toml as TOML."""
+    """Persist *config* to ~/.config/chuuni/config.toml as TOML.
+
+    Emits the TOML directly — the schema is flat scalars (plus arrays and
+    dates from hand-edited files) and optional one-level tables like
+    ``[cooldown]``, so a hand-rolled writer keeps tomli_w (and its import
+    cost on init / character use) out of the dependency set.  Reading
+    still goes through tomllib/tomli.  A value the writer cannot
+    represent is dropped with a warning rather than aborting the save.
+    """
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with CONFIG_FILE.open("wb") as f:
-        tomli_w.dump(config, f)
+    lines: list[str] = []
+    tables = []
+    # What actually lands in the TOML; the pickle sidecar must mirror it
+    # so both load paths agree after a lossy save.
+    written: dict[str, Any] = {}
+    for key, value in config.items():
+        if isinstance(value, dict):
+            tables.append((key, value))
+        else:
+            try:
+                lines.append(f"{key} = {_toml_repr(value)}\n")
+            except TypeError:
+                log.warning(
+                    "save_config: dropping %r (unsupported type %s)",
+                    key,
+                    type(value).__name__,
+                )
+            else:
+                written[key] = value
+    for name, table in tables:
+        lines.append(f"\n[{name}]\n")
+        written_table = written[name] = {}
+        for key, value in table.items():
+            try:
+                lines.append(f"{key} = {_toml_repr(value)}\n")
+            except TypeError:
+                log.warning(
+                    "save_config: dropping %r.%r (unsupported type %s)",
+                    name,
+                    key,
+                    type(value).__name__,
+                )
+            else:
+                written_table[key] = value
+    # Write-then-rename: a crash mid-write can't leave a torn config.toml,
+    # and readers never observe a half-written file.
+    tmp = CONFIG_FILE.with_suffix(".toml.tmp")
+    tmp.write_text("".join(lines), encoding="utf-8")
+    os.replace(tmp, CONFIG_FILE)
+
+    # Refresh the pickle sidecar so the next cold process skips the TOML
+    # parse.  Only the keys actually on disk are pickled — defaults are
+    # merged at load time so a package upgrade can add or change them.
+    # Best-effort: a failed write just means the slow path runs.
+    import pickle
+
+    try:
+        CONFIG_CACHE_FILE.write_bytes(pickle.dumps(written, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        pass
+    _invalidate_cache()
+
+
+@dataclass(slots=True)
+class ResolvedConfig:
+    """The config fields hot paths actually read, resolved once.
+
+    Attribute reads replace the repeated ``cfg.get(...)`` + merge pattern in
+    play/on-hook; built by :func:`resolved_config` and cached alongside the
+    parsed TOML.
+    """
+
+    enabled: bool
+    volume: float
+    character_dir: Path
+    cooldowns: dict[str, float]
+    default_cooldown: float
+    rvc_model_path: str
+    rvc_index_path: str
+
+
+_RESOLVED_CACHE: tuple[tuple[int, int] | None, ResolvedConfig] | None = None
+
+
+def resolved_config() -> ResolvedConfig:
+    """Return the memoized :class:`ResolvedConfig` for the current config file.
+
+    Shares the stat-based invalidation of :func:`load_config`: the resolved
+    view is rebuilt only when config.toml changes on disk (or is saved).
+    """
+    global _RESOLVED_CACHE
+
+    try:
+        st = os.stat(CONFIG_FILE)
+        key: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    cached = _RESOLVED_CACHE
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    cfg = load_config()
+    resolved = ResolvedConfig(
+        enabled=bool(cfg.get("enabled", True)),
+        volume=float(cfg.get("volume", 0.8)),
+        character_dir=get_character_dir(cfg),
+        cooldowns=get_cooldowns(cfg),
+        default_cooldown=float(cfg.get("cooldown_seconds", 5.0)),
+        rvc_model_path=cfg.get("rvc_model_path", ""),
+        rvc_index_path=cfg.get("rvc_index_path", ""),
+    )
+    _RESOLVED_CACHE = (key, resolved)
+    return resolved
 
 
 def get_character_dir(cfg: dict[str, Any]) -> Path:
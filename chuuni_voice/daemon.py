@@ -21,22 +21,25 @@ Daemon → client::
     {"ok": true, "queue_size": <int>}         — status response
 """
 
+import functools
 import json
 import logging
 import os
-import queue
+import select
 import signal
 import socket
+import struct
 import subprocess
 import threading
 import time
+from collections import deque
 from pathlib import Path
 
 _main_thread = threading.main_thread()
 
 log = logging.getLogger(__name__)
 
-CHUUNI_DIR = Path.home() / ".config" / "chuuni"
+CHUUNI_DIR = Path(os.environ.get("HOME") or os.path.expanduser("~"), ".config", "chuuni")
 SOCKET_PATH = CHUUNI_DIR / "chuuni.sock"
 PID_FILE = CHUUNI_DIR / "chuuni.pid"
 LOG_FILE = CHUUNI_DIR / "daemon.log"
@@ -44,6 +47,15 @@ LOG_FILE = CHUUNI_DIR / "daemon.log"
 _QUEUE_MAX = 8
 _CLIENT_TIMEOUT = 0.5
 
+# Shared response dicts for the two hot outcomes, with their wire encodings
+# precomputed.  _handle_conn identity-checks the dispatch result against
+# these so accepted and cooldown-rejected plays skip json.dumps entirely.
+# Never mutate them.
+_RESP_OK: dict = {"ok": True}
+_RESP_COOLDOWN: dict = {"ok": False, "reason": "cooldown"}
+_RESP_OK_BYTES = json.dumps(_RESP_OK).encode() + b"\n"
+_RESP_COOLDOWN_BYTES = json.dumps(_RESP_COOLDOWN).encode() + b"\n"
+
 
 # ---------------------------------------------------------------------------
 # Daemon
@@ -60,10 +72,18 @@ class AudioDaemon:
     ) -> None:
         self._cooldowns: dict[str, float] = cooldowns or {}
         self._default_cooldown = default_cooldown
-        self._last_played: dict[str, float] = {}
+        # event → [last_played].  Single-element lists so _handle_play can
+        # read and update an event's stamp with one dict probe.
+        self._last_played: dict[str, list[float]] = {}
         self._last_lock = threading.Lock()
-        self._queue: queue.Queue[tuple[str, float]] = queue.Queue()
+        # Bounded deque: append/popleft are single atomic ops, and maxlen
+        # makes overflow drop the oldest pending sound without the old
+        # lock-heavy qsize/get_nowait drain loop.  The event wakes the worker.
+        self._queue: deque[tuple[str, float]] = deque(maxlen=_QUEUE_MAX)
+        self._wake = threading.Event()
         self._running = False
+        self._pool = None  # created in run(); ThreadPoolExecutor for connections
+        self._wake_fd = -1  # write end of run()'s self-pipe
         self._worker = threading.Thread(
             target=self._worker_loop, daemon=True, name="chuuni-daemon-worker"
         )
@@ -81,38 +101,89 @@ class AudioDaemon:
         # Record PID so external tools can identify the process
         PID_FILE.write_text(str(os.getpid()))
 
+        # Audio cues are best-effort; deprioritize the daemon so it never
+        # competes with the user's build/test processes for CPU.
+        try:
+            os.nice(5)
+        except OSError:
+            pass
+
         self._worker.start()
         self._running = True
 
+        # Shared pool for connection handling: each request is one small JSON
+        # message + response, so a handful of reused workers beats paying
+        # thread creation (and a fresh stack) per accept under hook bursts.
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chuuni-conn")
+
+        # Self-pipe: signals (via set_wakeup_fd) and stop requests write a
+        # byte here, so the accept loop can block in select() indefinitely
+        # instead of waking every second to poll self._running.
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        self._wake_fd = wake_w
+
         def _handle_signal(sig: int, _frame: object) -> None:
             log.info("daemon: received signal %d — shutting down", sig)
             self._running = False
 
         # signal.signal() is only allowed on the main thread
+        wakeup_fd_set = False
         if threading.current_thread() is _main_thread:
             signal.signal(signal.SIGTERM, _handle_signal)
             signal.signal(signal.SIGINT, _handle_signal)
+            signal.set_wakeup_fd(wake_w)
+            wakeup_fd_set = True
 
         server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
             server.bind(str(SOCKET_PATH))
-            server.listen(16)
-            server.settimeout(1.0)  # allows periodic _running checks
+            # Deep backlog so hook bursts queue in the kernel instead of
+            # getting ECONNREFUSED while the accept loop hands off to the pool.
+            server.listen(64)
             log.info("daemon: listening on %s (pid=%d)", SOCKET_PATH, os.getpid())
 
             while self._running:
                 try:
-                    conn, _ = server.accept()
-                    threading.Thread(
-                        target=self._handle_conn, args=(conn,), daemon=True
-                    ).start()
-                except socket.timeout:
+                    ready, _, _ = select.select([server, wake_r], [], [])
+                except OSError:
+                    break
+                if wake_r in ready:
+                    # Drain the pipe; the loop condition re-checks _running.
+                    try:
+                        while os.read(wake_r, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
                     continue
+                try:
+                    conn, _ = server.accept()
+                    self._pool.submit(self._handle_conn, conn)
                 except OSError:
                     break
         finally:
+            if wakeup_fd_set:
+                signal.set_wakeup_fd(-1)
+            self._wake_fd = -1
+            for fd in (wake_r, wake_w):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
             self._cleanup(server)
 
+    def _poke(self) -> None:
+        """Wake the select() in run() (e.g. after a stop request)."""
+        fd = self._wake_fd
+        if fd != -1:
+            try:
+                os.write(fd, b"\x00")
+            except OSError:
+                pass
+
     # ------------------------------------------------------------------
     # Connection handler (runs in its own thread per client)
 
@@ -120,24 +191,42 @@ class AudioDaemon:
         """Read one request from *conn*, dispatch, write response."""
         try:
             with conn:
+                # Linux: reject peers running as a different uid before
+                # reading anything — the socket lives in our own config dir,
+                # so any foreign uid is noise or abuse.  Platforms without
+                # SO_PEERCRED (macOS) fall through to the normal path.
+                if hasattr(socket, "SO_PEERCRED"):
+                    creds = conn.getsockopt(
+                        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+                    )
+                    _pid, uid, _gid = struct.unpack("3i", creds)
+                    if uid != os.getuid():
+                        log.debug("daemon: rejected connection from uid %d", uid)
+                        return
+
                 conn.settimeout(0.5)
-                data = b""
+                # bytearray.extend grows one buffer in place; `bytes +=`
+                # would reallocate and copy the accumulated data per chunk.
+                buf = bytearray()
                 try:
                     while True:
                         chunk = conn.recv(4096)
                         if not chunk:
                             break
-                        data += chunk
-                        if b"\n" in data:
+                        buf.extend(chunk)
+                        # The delimiter is one byte, so only the newest chunk
+                        # needs scanning — earlier ones were checked already.
+                        if b"\n" in chunk:
                             break
                 except socket.timeout:
                     pass
 
-                if not data.strip():
+                if not buf.strip():
                     return
 
                 try:
-                    msg: dict = json.loads(data.decode().strip())
+                    # json.loads takes bytes directly — no decode/strip copies.
+                    msg: dict = json.loads(bytes(buf))
                 except Exception:
                     conn.sendall(
                         json.dumps({"ok": False, "reason": "bad JSON"}).encode() + b"\n"
@@ -145,7 +234,12 @@ class AudioDaemon:
                     return
 
                 resp = self._dispatch(msg)
-                conn.sendall(json.dumps(resp).encode() + b"\n")
+                if resp is _RESP_OK:
+                    conn.sendall(_RESP_OK_BYTES)
+                elif resp is _RESP_COOLDOWN:
+                    conn.sendall(_RESP_COOLDOWN_BYTES)
+                else:
+                    conn.sendall(json.dumps(resp).encode() + b"\n")
         except Exception as exc:
             log.debug("daemon: _handle_conn error: %s", exc)
 
@@ -159,11 +253,12 @@ class AudioDaemon:
         if msg_type == "status":
             return {
                 "ok": True,
-                "queue_size": self._queue.qsize(),
+                "queue_size": len(self._queue),
             }
         if msg_type == "stop":
             self._running = False
-            return {"ok": True}
+            self._poke()
+            return _RESP_OK
         return {"ok": False, "reason": f"unknown type: {msg_type!r}"}
 
     def _handle_play(self, msg: dict) -> dict:
@@ -173,30 +268,32 @@ class AudioDaemon:
         volume = float(msg.get("volume", 0.8))
 
         cooldown = self._cooldowns.get(event, self._default_cooldown)
-        now = time.time()
+        # monotonic: immune to NTP/wall-clock jumps and cheaper to read.
+        # The default of -inf keeps the first play unconditionally allowed —
+        # monotonic time starts near zero, so 0.0 would falsely block it.
+        now = time.monotonic()
         with self._last_lock:
-            last = self._last_played.get(event, 0.0)
+            entry = self._last_played.get(event)
+            last = entry[0] if entry is not None else float("-inf")
             if now - last < cooldown:
                 remaining = cooldown - (now - last)
                 log.debug(
                     "daemon: cooldown active for %s (%.1fs remaining)", event, remaining
                 )
-                return {"ok": False, "reason": "cooldown"}
+                return _RESP_COOLDOWN
 
-            self._last_played[event] = now
+            if entry is not None:
+                entry[0] = now  # in-place: no second hash of the key
+            else:
+                self._last_played[event] = [now]
 
         if audio_path:
-            # Drop oldest pending item if queue is full
-            while self._queue.qsize() >= _QUEUE_MAX:
-                try:
-                    self._queue.get_nowait()
-                    self._queue.task_done()
-                except queue.Empty:
-                    break
-            self._queue.put_nowait((audio_path, volume))
+            # maxlen evicts the oldest pending item automatically when full.
+            self._queue.append((audio_path, volume))
+            self._wake.set()
             log.debug("daemon: enqueued %s (event=%s)", audio_path, event)
 
-        return {"ok": True}
+        return _RESP_OK
 
     # ------------------------------------------------------------------
     # Worker thread
@@ -204,13 +301,22 @@ class AudioDaemon:
     def _worker_loop(self) -> None:
         """Consume (path, volume) items from the queue and play serially."""
         while True:
-            path, volume = self._queue.get()
+            try:
+                path, volume = self._queue.popleft()
+            except IndexError:
+                # Clear-then-recheck closes the race where a producer appends
+                # and sets the event between our popleft and clear: either the
+                # recheck sees the item, or the set lands after clear and
+                # wait() returns immediately.
+                self._wake.clear()
+                if self._queue:
+                    continue
+                self._wake.wait()
+                continue
             try:
                 _play_audio(path, volume)
             except Exception as exc:
                 log.debug("daemon: worker error: %s", exc)
-            finally:
-                self._queue.task_done()
 
     # ------------------------------------------------------------------
     # Cleanup
@@ -220,6 +326,8 @@ class AudioDaemon:
             server.close()
         except Exception:
             pass
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
         for path in (SOCKET_PATH, PID_FILE):
             try:
                 path.unlink(missing_ok=True)
@@ -235,12 +343,37 @@ class AudioDaemon:
 
 def is_running() -> bool:
     """Return True if the daemon socket exists and the daemon responds."""
-    if not SOCKET_PATH.exists():
+    try:
+        # One stat syscall; Path.exists() builds the same call behind extra
+        # Path machinery, and a missing socket (the common cold-start case)
+        # should not cost a connect attempt.
+        os.stat(SOCKET_PATH)
+    except OSError:
         return False
     resp = _send({"type": "status"})
     return resp is not None and bool(resp.get("ok"))
 
 
+def wait_running(want: bool, timeout: float) -> bool:
+    """Poll until ``is_running() == want`` or *timeout* elapses.
+
+    Uses exponential backoff (5 ms doubling to a 100 ms cap) so a daemon that
+    binds its socket quickly — the usual case — is detected within a few
+    milliseconds instead of a full fixed poll tick, while a slow one costs no
+    more wakeups than the old 100 ms loop.
+    """
+    deadline = time.monotonic() + timeout
+    interval = 0.005
+    while True:
+        if is_running() == want:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, 0.1)
+
+
 def send_play(event: str, audio_path: str, volume: float) -> dict | None:
     """Ask the daemon to play *audio_path* for *event*.
 
@@ -271,7 +404,7 @@ def _send(msg: dict, timeout: float = _CLIENT_TIMEOUT) -> dict | None:
         sock.settimeout(timeout)
         sock.connect(str(SOCKET_PATH))
         sock.sendall(json.dumps(msg).encode() + b"\n")
-        data = b""
+        buf = bytearray()
         while True:
             try:
                 chunk = sock.recv(4096)
@@ -279,12 +412,12 @@ def _send(msg: dict, timeout: float = _CLIENT_TIMEOUT) -> dict | None:
                 break
             if not chunk:
                 break
-            data += chunk
-            if b"\n" in data:
+            buf.extend(chunk)
+            if b"\n" in chunk:
                 break
         sock.close()
-        if data.strip():
-            return json.loads(data.decode().strip())
+        if buf.strip():
+            return json.loads(bytes(buf))
         return None
     except Exception:
         return None
@@ -295,16 +428,38 @@ def _send(msg: dict, timeout: float = _CLIENT_TIMEOUT) -> dict | None:
 # ---------------------------------------------------------------------------
 
 
+# player._build_command, bound on first use.  Not a top-level import:
+# importing player starts its own playback worker thread, which the daemon
+# (with its own queue/worker) must not do just by being imported.
+_player_build_command = None
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_build_command(path_str: str, volume: float) -> tuple[str, ...] | None:
+    """player._build_command memoized on (path, volume).
+
+    On Linux the command builder probes PATH for an installed player; the
+    same few clips replay all session, so cache the resolved argv.  Tuples
+    keep cached entries immutable.  Volume is pre-quantized by the caller so
+    the key space stays small.
+    """
+    global _player_build_command
+    if _player_build_command is None:
+        from chuuni_voice.player import _build_command as _player_build_command
+
+    cmd = _player_build_command(Path(path_str), volume)
+    return None if cmd is None else tuple(cmd)
+
+
 def _play_audio(path: str, volume: float) -> None:
     """Blocking audio playback via the system player."""
-    from chuuni_voice.player import _build_command
-
     try:
-        p = Path(path)
-        if not p.exists():
+        try:
+            os.stat(path)
+        except OSError:
             log.debug("_play_audio: file not found: %s", path)
             return
-        cmd = _build_command(p, volume)
+        cmd = _cached_build_command(path, round(volume, 2))
         if cmd is None:
             log.debug("_play_audio: no suitable player found")
             return
@@ -1,6 +1,8 @@
 """ChuuniEvent enum and default Japanese voice lines."""
 
 import random
+import sys
+from collections import deque
 from enum import Enum
 
 
@@ -15,11 +17,19 @@ class ChuuniEvent(Enum):
     PERMISSION_PROMPT = "permission_prompt"
 
 
+# Event values are used as dict keys all over the hot paths (cooldown tables,
+# the audio index, _EVENT_BY_VALUE).  Interning them lets those lookups take
+# CPython's pointer-identity fast path instead of comparing characters.
+for _e in ChuuniEvent:
+    _e._value_ = sys.intern(_e.value)
+del _e
+
+
 # ---------------------------------------------------------------------------
 # Default lines — 3 per event, chuuni style
 # ---------------------------------------------------------------------------
 
-LINES: dict[ChuuniEvent, list[str]] = {
+LINES: dict[ChuuniEvent, tuple[str, ...]] = {
     ChuuniEvent.TASK_START: [
         "参る！",
         "いくぞ、全力で！",
@@ -62,7 +72,26 @@ LINES: dict[ChuuniEvent, list[str]] = {
     ],
 }
 
+# Freeze the line lists: tuples are cheaper to sample from and can't be
+# mutated out from under the shuffled cycles below.
+LINES = {k: tuple(v) for k, v in LINES.items()}
+
+# Private generator instance — skips the lock/global-lookup indirection of
+# the module-level random functions.
+_rng = random.Random()
+
+
+# Per-event shuffled rotations, built lazily on first use.  Rotating a deque
+# is O(1) per call and guarantees no repeats within a cycle — independent
+# random draws both cost more and repeat the same line audibly often.
+_cycles: dict[ChuuniEvent, deque[str]] = {}
+
 
 def get_line(event: ChuuniEvent) -> str:
-    """Return a random Japanese line for *event*."""
-    return random.choice(LINES[event])
+    """Return the next Japanese line for *event* (shuffled, non-repeating cycle)."""
+    cycle = _cycles.get(event)
+    if cycle is None:
+        lines = LINES[event]
+        cycle = _cycles[event] = deque(_rng.sample(lines, len(lines)))
+    cycle.rotate(-1)
+    return cycle[0]
@@ -19,11 +19,18 @@ Stop               + (any)               → TASK_DONE
 ──────────────────────────────────────────────────────────────────────────────
 """
 
+import functools
 import json
+import os
 import shutil
 import sys
 from pathlib import Path
 
+try:  # optional dependency — stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 # ---------------------------------------------------------------------------
 # Core: generate hooks config dict
@@ -92,8 +99,7 @@ def inject_hooks(settings_path: Path | None = None) -> None:
     settings: dict = {}
     if not is_new:
         try:
-            with target.open() as f:
-                settings = json.load(f)
+            settings = _load_settings(target)
         except (json.JSONDecodeError, OSError):
             settings = {}
         # Backup before any mutation
@@ -104,27 +110,24 @@ def inject_hooks(settings_path: Path | None = None) -> None:
         target.parent.mkdir(parents=True, exist_ok=True)
         print(f"  Creating   →  {target}")
 
-    # Remove stale chuuni entries (idempotent re-injection)
+    # Strip stale chuuni entries, append fresh ones, and drop now-empty
+    # event lists in a single walk over each event list (idempotent
+    # re-injection without the separate strip/inject/cleanup passes).
     existing_hooks: dict[str, list] = settings.get("hooks", {})
-    for event in list(existing_hooks):
-        existing_hooks[event] = [
-            e for e in existing_hooks[event]
-            if not _is_chuuni_entry(e)
-        ]
-
-    # Inject fresh entries
     chuuni_bin = _find_chuuni_bin()
     new_hooks = generate_hooks_config(chuuni_bin)
+    merged: dict[str, list] = {}
+    for event, entries in existing_hooks.items():
+        kept = [e for e in entries if not _is_chuuni_entry(e)]
+        kept.extend(new_hooks.get(event, ()))
+        if kept:
+            merged[event] = kept
     for event, entries in new_hooks.items():
-        existing_hooks.setdefault(event, [])
-        existing_hooks[event].extend(entries)
-
-    # Drop now-empty event lists
-    settings["hooks"] = {k: v for k, v in existing_hooks.items() if v}
+        if event not in existing_hooks:
+            merged[event] = list(entries)
+    settings["hooks"] = merged
 
-    with target.open("w") as f:
-        json.dump(settings, f, indent=2)
-        f.write("\n")
+    _write_settings(target, settings)
 
     # Summary
     total = sum(len(v) for v in new_hooks.items())
@@ -158,8 +161,7 @@ def remove_hooks(settings_path: Path | None = None) -> None:
         return
 
     try:
-        with target.open() as f:
-            settings = json.load(f)
+        settings = _load_settings(target)
     except (json.JSONDecodeError, OSError) as exc:
         print(f"  Could not read {target}: {exc}")
         return
@@ -167,16 +169,15 @@ def remove_hooks(settings_path: Path | None = None) -> None:
     existing_hooks: dict[str, list] = settings.get("hooks", {})
     removed = 0
 
-    for event in list(existing_hooks):
-        before = len(existing_hooks[event])
-        existing_hooks[event] = [
-            e for e in existing_hooks[event]
-            if not _is_chuuni_entry(e)
-        ]
-        removed += before - len(existing_hooks[event])
+    # Filter, count, and drop now-empty event lists in one walk
+    clean: dict[str, list] = {}
+    for event, entries in existing_hooks.items():
+        kept = [e for e in entries if not _is_chuuni_entry(e)]
+        removed += len(entries) - len(kept)
+        if kept:
+            clean[event] = kept
 
-    # Drop now-empty event lists; drop hooks key if nothing remains
-    clean = {k: v for k, v in existing_hooks.items() if v}
+    # Drop the hooks key entirely if nothing remains
     if clean:
         settings["hooks"] = clean
     elif "hooks" in settings:
@@ -187,9 +188,7 @@ def remove_hooks(settings_path: Path | None = None) -> None:
     shutil.copy2(target, backup)
     print(f"  Backed up  →  {backup}")
 
-    with target.open("w") as f:
-        json.dump(settings, f, indent=2)
-        f.write("\n")
+    _write_settings(target, settings)
 
     if removed:
         print(f"  Removed    →  {removed} chuuni hook entries from {target}")
@@ -202,8 +201,54 @@ def remove_hooks(settings_path: Path | None = None) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Below this size the map/unmap setup costs more than it saves; read normally.
+_MMAP_THRESHOLD = 16384
+
+
+def _dump_settings(settings: dict) -> bytes:
+    """Serialize *settings* to pretty-printed JSON bytes (trailing newline).
+
+    orjson serializes straight to bytes, skipping stdlib json's text-codec
+    pass; a single write_bytes then lands it in one write(2) call.
+    """
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(settings, indent=2) + "\n").encode()
+
+
+def _write_settings(target: Path, settings: dict) -> None:
+    """Atomically replace *target* with the serialized *settings*.
+
+    Writing in place truncates first, so a crash mid-write would leave a
+    corrupt settings.json; writing a sibling tmp file and os.replace-ing it
+    into place makes the swap a single atomic rename.
+    """
+    tmp = target.with_suffix(".json.tmp")
+    tmp.write_bytes(_dump_settings(settings))
+    os.replace(tmp, target)
+
+
+def _load_settings(path: Path) -> dict:
+    """Parse *path* as JSON, memory-mapping large files.
+
+    Big settings.json files (heavily customised Claude Code setups) get
+    demand-paged straight from the page cache instead of going through the
+    buffered-read path; small ones take the plain read.  Raises
+    json.JSONDecodeError / OSError like json.load would.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            import mmap
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return json.loads(mm[:])
+        return json.loads(f.read())
+
+
 def _default_settings_path() -> Path:
-    return Path.home() / ".claude" / "settings.json"
+    return Path(
+        os.environ.get("HOME") or os.path.expanduser("~"), ".claude", "settings.json"
+    )
 
 
 def _is_chuuni_entry(entry: dict) -> bool:
@@ -211,19 +256,22 @@ def _is_chuuni_entry(entry: dict) -> bool:
 
     Detection: the base name of the first word in the command is ``chuuni``.
     This is robust to full paths (e.g. /home/user/.venv/bin/chuuni play ...).
+    Plain string slicing — constructing a Path per scanned command is
+    needless overhead in the settings-scan loop.
     """
     hooks = entry.get("hooks", [])
     if not hooks:
         return False
     return all(
-        Path(h.get("command", "").split()[0]).name == "chuuni"
+        h["command"].split(None, 1)[0].rpartition("/")[2] == "chuuni"
         for h in hooks
         if h.get("command")
     )
 
 
+@functools.cache
 def _find_chuuni_bin() -> str:
-    """Return the absolute path to the chuuni binary.
+    """Return the absolute path to the chuuni binary (cached per process).
 
     Search order:
       1. shutil.which("chuuni")          — works when chuuni is on PATH
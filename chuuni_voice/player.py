@@ -6,31 +6,38 @@ Design goals:
   returns immediately.
 - Cooldown: each event has an independent per-event cooldown (default 3 s).
   A second trigger within the window is silently dropped.
-  State is persisted to ~/.config/chuuni/cooldown.json and protected by a
-  file lock so cooldown works correctly across concurrent chuuni processes.
+  State is persisted as one stamp file per event under ~/.config/chuuni
+  (the file's mtime is the last play time), so cooldown works correctly
+  across concurrent chuuni processes without any locking.
 - Serial queue: play_event() feeds a single background worker so sounds from
   different events are played one after another without overlap.  The queue
   holds at most 3 pending items; the oldest is dropped when it overflows.
 - Graceful degrade: no audio file → debug log.  No player binary → debug log.
 """
 
-import json
+import functools
 import logging
+import os
 import platform
-import queue
 import random
+import re
 import shutil
+import stat
 import subprocess
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from filelock import FileLock
-
 from chuuni_voice.events import ChuuniEvent
 
 log = logging.getLogger(__name__)
 
+# Resolved once: platform.system() goes through os.uname() on every call,
+# and the answer never changes for the life of the process.
+_SYSTEM = platform.system()
+
 # Searched in this priority order for each event stem
 _AUDIO_EXTS = [".mp3", ".wav", ".ogg", ".aiff", ".flac"]
 
@@ -58,44 +65,40 @@ _LINUX_PLAYERS: list[tuple[str, object]] = [
 # Cross-process cooldown state (file-backed)
 # ---------------------------------------------------------------------------
 
-COOLDOWN_DIR = Path.home() / ".config" / "chuuni"
-COOLDOWN_FILE = COOLDOWN_DIR / "cooldown.json"
-COOLDOWN_LOCK_FILE = COOLDOWN_DIR / "cooldown.lock"
+COOLDOWN_DIR = Path(os.environ.get("HOME") or os.path.expanduser("~"), ".config", "chuuni")
 
 
 def _check_and_claim_cooldown(event_value: str, cooldown: float) -> bool:
     """Return True (and record the play time) if the event may proceed.
 
-    Acquires a file lock before reading/writing so this is safe across
-    concurrent ``chuuni play`` processes.  Falls open (returns True) if the
-    lock cannot be acquired within 1 s.
+    State is one empty stamp file per event (``<event>.stamp``); its mtime
+    is the last play time.  mtime updates are atomic at the inode level,
+    so a single stat + utime replaces the old lock-file/read/rewrite dance
+    — no lock, no parse, no fsync on the hot path.  Falls open (returns
+    True) on any filesystem error.
     """
-    COOLDOWN_DIR.mkdir(parents=True, exist_ok=True)
-    lock = FileLock(str(COOLDOWN_LOCK_FILE), timeout=1)
+    path = COOLDOWN_DIR / f"{event_value}.stamp"
     try:
-        with lock:
-            data: dict[str, float] = {}
-            if COOLDOWN_FILE.exists():
-                try:
-                    data = json.loads(COOLDOWN_FILE.read_text())
-                except (json.JSONDecodeError, OSError):
-                    data = {}
-
-            now = time.time()
-            last = data.get(event_value, 0.0)
-            if now - last < cooldown:
-                log.debug(
-                    "play_event: cooldown active for %s (%.1fs remaining), skipping",
-                    event_value,
-                    cooldown - (now - last),
-                )
-                return False
-
-            data[event_value] = now
-            COOLDOWN_FILE.write_text(json.dumps(data))
-            return True
+        now = time.time()
+        try:
+            last = os.stat(path).st_mtime
+        except FileNotFoundError:
+            last = None
+        if last is not None and now - last < cooldown:
+            log.debug(
+                "play_event: cooldown active for %s (%.1fs remaining), skipping",
+                event_value,
+                cooldown - (now - last),
+            )
+            return False
+
+        if last is None:
+            COOLDOWN_DIR.mkdir(parents=True, exist_ok=True)
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+        os.utime(path, (now, now))
+        return True
     except Exception as exc:
-        log.debug("_check_and_claim_cooldown: lock error: %s — proceeding anyway", exc)
+        log.debug("_check_and_claim_cooldown: error: %s — proceeding anyway", exc)
         return True
 
 
@@ -104,15 +107,21 @@ def _check_and_claim_cooldown(event_value: str, cooldown: float) -> bool:
 # ---------------------------------------------------------------------------
 
 _QUEUE_MAX = 3
-_play_queue: queue.Queue[tuple[str, float]] = queue.Queue()
+# Bounded deque: append past maxlen drops the oldest item in C, which is the
+# exact "drop oldest on overflow" semantic the old qsize()/get_nowait() loop
+# implemented with several lock round-trips per enqueue.
+_play_buf: deque[tuple[str, float]] = deque(maxlen=_QUEUE_MAX)
+_play_cv = threading.Condition()
 
 
 def _queue_worker() -> None:
     """Daemon worker: consume (path, volume) tasks and play them serially."""
     while True:
-        path, volume = _play_queue.get()
+        with _play_cv:
+            while not _play_buf:
+                _play_cv.wait()
+            path, volume = _play_buf.popleft()
         _play_blocking_wait(path, volume)
-        _play_queue.task_done()
 
 
 _worker_thread = threading.Thread(
@@ -125,15 +134,11 @@ def _enqueue_task(path: str, volume: float) -> None:
     """Put (path, volume) in the playback queue.
 
     If the queue already holds *_QUEUE_MAX* pending items, the oldest one is
-    dropped first to prevent unbounded accumulation.
+    dropped (by the deque's maxlen) to prevent unbounded accumulation.
     """
-    while _play_queue.qsize() >= _QUEUE_MAX:
-        try:
-            _play_queue.get_nowait()
-            _play_queue.task_done()
-        except queue.Empty:
-            break
-    _play_queue.put_nowait((path, volume))
+    with _play_cv:
+        _play_buf.append((path, volume))
+        _play_cv.notify()
 
 
 # ---------------------------------------------------------------------------
@@ -141,8 +146,14 @@ def _enqueue_task(path: str, volume: float) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Reused by play_file instead of spawning a fresh thread per call; two
+# workers is plenty for fire-and-forget launches that don't wait on the
+# player process.  Workers are created lazily on first submit.
+_file_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chuuni-play")
+
+
 def play_file(path: str, volume: float = 0.8) -> None:
-    """Play *path* in a background daemon thread (fire-and-forget).
+    """Play *path* on a pooled background thread (fire-and-forget).
 
     Returns immediately.  Never raises.
 
@@ -151,12 +162,7 @@ def play_file(path: str, volume: float = 0.8) -> None:
         volume: Playback volume in [0.0, 1.0].  Clamped silently.
     """
     volume = max(0.0, min(1.0, volume))
-    t = threading.Thread(
-        target=_play_blocking,
-        args=(path, volume),
-        daemon=True,
-    )
-    t.start()
+    _file_pool.submit(_play_blocking, path, volume)
 
 
 def play_event(
@@ -168,8 +174,8 @@ def play_event(
 
     Cooldown check (per-event from config):
       If the same event was played within its cooldown window, the call is
-      silently dropped.  Cooldown state is shared across processes via a
-      file lock at ~/.config/chuuni/cooldown.json.
+      silently dropped.  Cooldown state is shared across processes via
+      per-event stamp files under ~/.config/chuuni.
 
     Filename matching rules (case-insensitive stem):
       - Exact:    ``<event_value>.<ext>``          e.g. ``coding.mp3``
@@ -181,16 +187,17 @@ def play_event(
     Silent failure on missing directory, missing files, or playback errors.
     """
     try:
-        from chuuni_voice.config import get_cooldowns, load_config, get_character_dir
-        cfg = load_config()
-        cooldowns = get_cooldowns(cfg)
-        cooldown = cooldowns.get(event.value, float(cfg.get("cooldown_seconds", 5.0)))
+        # resolved_config is memoized on the config file's mtime, so this
+        # costs a stat per call instead of a TOML parse per hook invocation.
+        from chuuni_voice.config import resolved_config
+        cfg = resolved_config()
+        cooldown = cfg.cooldowns.get(event.value, cfg.default_cooldown)
 
         if not _check_and_claim_cooldown(event.value, cooldown):
             return
 
         if character_dir is None:
-            character_dir = str(get_character_dir(cfg))
+            character_dir = str(cfg.character_dir)
 
         candidates = _find_candidates(event, Path(character_dir))
         if not candidates:
@@ -261,14 +268,12 @@ def _play_blocking_wait(path: str, volume: float) -> None:
 
 def _build_command(path: Path, volume: float) -> list[str] | None:
     """Return the OS-appropriate player argv, or None if unavailable."""
-    system = platform.system()
-
-    if system == "Darwin":
+    if _SYSTEM == "Darwin":
         return _mac_command(path, volume)
-    if system == "Linux":
+    if _SYSTEM == "Linux":
         return _linux_command(path, volume)
 
-    log.debug("_build_command: unsupported platform %r", system)
+    log.debug("_build_command: unsupported platform %r", _SYSTEM)
     return None
 
 
@@ -277,20 +282,41 @@ def _mac_command(path: Path, volume: float) -> list[str]:
     return ["afplay", "-v", str(volume), str(path)]
 
 
-def _linux_command(path: Path, volume: float) -> list[str] | None:
-    """Try paplay → aplay → mpg123 in order; return first available."""
+@functools.cache
+def _resolved_linux_player() -> tuple[str, object] | None:
+    """Probe the fallback chain once and return the first available entry.
+
+    shutil.which walks every $PATH directory; the answer is static for the
+    process lifetime, so cache it instead of re-probing on every playback.
+    """
     for binary, args_fn in _LINUX_PLAYERS:
         if shutil.which(binary) is not None:
-            return [binary] + args_fn(path, volume)
-    log.debug("_linux_command: tried paplay, aplay, mpg123 — none found in PATH")
+            return binary, args_fn
     return None
 
 
+def _linux_command(path: Path, volume: float) -> list[str] | None:
+    """Try paplay → aplay → mpg123 in order; return first available."""
+    player = _resolved_linux_player()
+    if player is None:
+        log.debug("_linux_command: tried paplay, aplay, mpg123 — none found in PATH")
+        return None
+    binary, args_fn = player
+    return [binary] + args_fn(path, volume)
+
+
 # ---------------------------------------------------------------------------
 # Internal: candidate discovery
 # ---------------------------------------------------------------------------
 
 
+# Per-directory candidate cache: dir → (dir mtime_ns, {event value → candidates}).
+# Character dirs change rarely; caching on the directory mtime turns the
+# per-play glob storm into a dict lookup, and a re-scan happens automatically
+# whenever a file is added or removed (which bumps the directory mtime).
+_dir_cache: dict[Path, tuple[int, dict[str, list[Path]]]] = {}
+
+
 def _find_candidates(event: ChuuniEvent, character_dir: Path) -> list[Path]:
     """Return all audio files in *character_dir* whose name ends with ``_<event>.<ext>``.
 
@@ -301,17 +327,69 @@ def _find_candidates(event: ChuuniEvent, character_dir: Path) -> list[Path]:
         custom_task_start.mp3
 
     Also matches the bare ``<event>.<ext>`` form (e.g. ``task_start.mp3``).
+
+    Results are memoized per (directory, event) and invalidated when the
+    directory's mtime advances, so repeat plays skip the filesystem entirely.
+    """
+    try:
+        st = character_dir.stat()
+    except OSError:
+        return []
+    if not stat.S_ISDIR(st.st_mode):
+        return []
+
+    cached = _dir_cache.get(character_dir)
+    if cached is None or cached[0] != st.st_mtime_ns:
+        cached = (st.st_mtime_ns, {})
+        _dir_cache[character_dir] = cached
+
+    index = cached[1]
+    candidates = index.get(event.value)
+    if candidates is None:
+        candidates = index[event.value] = _scan_candidates(event, character_dir)
+    return candidates
+
+
+@functools.lru_cache(maxsize=64)
+def _event_pattern(stem: str) -> re.Pattern[str]:
+    """Compiled matcher for *stem*: ``<anything>_<stem>.<ext>`` or ``<stem>.<ext>``.
+
+    One C-level regex match per directory entry replaces the
+    splitext + endswith classification; compiled once per event.
     """
-    if not character_dir.is_dir():
+    exts = "|".join(re.escape(ext[1:]) for ext in _AUDIO_EXTS)
+    return re.compile(rf"^(?P<variant>.*_)?{re.escape(stem)}\.(?P<ext>{exts})$")
+
+
+def _scan_candidates(event: ChuuniEvent, character_dir: Path) -> list[Path]:
+    """Scan *character_dir* for audio files matching *event* (uncached).
+
+    One os.scandir pass classifies every entry against a precompiled
+    regex instead of one glob (each a full directory re-read) per extension.
+    """
+    pattern = _event_pattern(event.value)
+    variants: dict[str, list[str]] = {ext: [] for ext in _AUDIO_EXTS}
+    exact: dict[str, str] = {}
+    try:
+        with os.scandir(character_dir) as entries:
+            for entry in entries:
+                m = pattern.match(entry.name)
+                if m is None:
+                    continue
+                ext = "." + m["ext"]
+                if m["variant"] is None:
+                    exact[ext] = entry.name
+                else:
+                    variants[ext].append(entry.name)
+    except OSError:
         return []
 
-    stem = event.value  # e.g. "task_start"
+    # Extension priority first; within an extension, _<event> variants in
+    # scan order then the bare <event> form.  Variant order is not sorted:
+    # the caller picks with random.choice, so ordering there is irrelevant.
     candidates: list[Path] = []
     for ext in _AUDIO_EXTS:
-        # Files ending with _<event>.<ext>
-        candidates.extend(sorted(character_dir.glob(f"*_{stem}{ext}")))
-        # Bare <event>.<ext>
-        exact = character_dir / f"{stem}{ext}"
-        if exact.exists() and exact not in candidates:
-            candidates.append(exact)
+        candidates.extend(character_dir / name for name in variants[ext])
+        if ext in exact:
+            candidates.append(character_dir / exact[ext])
     return candidates
@@ -9,10 +9,14 @@ Strategy:
 """
 
 import logging
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from chuuni_voice.events import ChuuniEvent
 
@@ -20,6 +24,7 @@ log = logging.getLogger(__name__)
 
 # Audio extensions searched in priority order (mirrors player.py)
 _AUDIO_EXTS = [".mp3", ".wav", ".ogg", ".aiff", ".flac"]
+_EXT_PRIORITY = {ext: i for i, ext in enumerate(_AUDIO_EXTS)}
 
 
 # ---------------------------------------------------------------------------
@@ -54,26 +59,105 @@ class RVCClient:
         self.timeout = timeout
         self.fn_index = fn_index
         self._base = f"http://{host}:{port}"
+        self._predict_url = self._base + self._PREDICT_PATH
+        # Payload skeleton with the invariant vc_single fields filled in;
+        # convert() copies the data list and slots in the per-call values
+        # instead of rebuilding the whole structure each time.
+        self._payload_data_template: list = [
+            0,           # spk_id
+            None,        # [1] input_path
+            0,           # f0_up_key (pitch shift)
+            "",          # f0_file
+            "rmvpe",     # f0_method
+            None,        # [5] file_index
+            0.75,        # index_rate
+            3,           # filter_radius
+            0,           # resample_sr
+            0.25,        # rms_mix_rate
+            0.33,        # protect
+            None,        # [11] model_name
+        ]
+        # Split timeouts: fail fast on connection problems (the port being
+        # closed or firewalled) while staying patient on inference time.
+        self._connect_timeout = 2.0
+        self._read_timeout = float(timeout)
+        # Persistent session: keep-alive reuses the same TCP connection for
+        # the availability probe and the predict calls instead of paying a
+        # fresh handshake per request.
+        self._session = requests.Session()
+        self._session.mount(
+            "http://", HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        )
+        # Availability probe cache: (monotonic timestamp, result).  A burst
+        # of events would otherwise probe the server once per event — and
+        # stall for the full probe timeout each time when it's down.
+        self._avail_cache: tuple[float, bool] | None = None
+        self._avail_ttl = 5.0
+        # Single background worker for fire-and-forget conversions;
+        # created lazily so synchronous-only users never pay for it.
+        self._convert_pool: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def with_timeouts(
+        cls, connect: float = 2.0, read: float = 60.0, **kwargs: object
+    ) -> "RVCClient":
+        """Build a client with an explicit (connect, read) timeout split.
+
+        Useful for large models or long clips whose inference legitimately
+        exceeds the default read timeout.
+        """
+        client = cls(**kwargs)  # type: ignore[arg-type]
+        client._connect_timeout = float(connect)
+        client._read_timeout = float(read)
+        return client
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def is_available(self) -> bool:
-        """Return True if the RVC WebUI server responds to a GET /.
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._convert_pool is not None:
+            self._convert_pool.shutdown(wait=False)
+        self._session.close()
+
+    def __enter__(self) -> "RVCClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
-        Uses a short 3-second timeout so callers don't stall.
+    def is_available(self) -> bool:
+        """Return True if the RVC WebUI server responds to a HEAD /.
+
+        HEAD skips the multi-hundred-KB Gradio UI body a GET would pull
+        down, and the 1-second timeout keeps the worst-case stall short
+        when the server is absent.  The result
+        is cached for a few seconds so a burst of events costs one probe,
+        not one per event; call :meth:`invalidate_availability` to force
+        a fresh probe.
         """
+        now = time.monotonic()
+        cached = self._avail_cache
+        if cached is not None and now - cached[0] < self._avail_ttl:
+            return cached[1]
+
         try:
-            requests.get(self._base + "/", timeout=3)
-            return True
+            self._session.head(self._base + "/", timeout=1.0, allow_redirects=False)
+            result = True
         except Exception:
-            return False
+            result = False
+        self._avail_cache = (now, result)
+        return result
+
+    def invalidate_availability(self) -> None:
+        """Drop the cached availability result so the next check re-probes."""
+        self._avail_cache = None
 
     def convert(
         self,
-        input_path: str,
-        output_path: str,
+        input_path: str | os.PathLike[str],
+        output_path: str | os.PathLike[str],
         model_name: str,
         index_path: str = "",
     ) -> bool:
@@ -84,15 +168,20 @@ class RVCClient:
         *output_path*; otherwise the caller is expected to detect the result
         by checking whether *output_path* exists after this call.
 
+        Accepts str or Path; paths are stringified once at the JSON
+        boundary rather than roundtripped through Path per call.
+
         Returns True if the server reported success, False on any failure.
         Never raises.
         """
         try:
+            input_path = os.fspath(input_path)
+            output_path = os.fspath(output_path)
             payload = self._build_payload(input_path, model_name, index_path)
-            r = requests.post(
-                self._base + self._PREDICT_PATH,
+            r = self._session.post(
+                self._predict_url,
                 json=payload,
-                timeout=self.timeout,
+                timeout=(self._connect_timeout, self._read_timeout),
             )
 
             if not r.ok:
@@ -115,10 +204,44 @@ class RVCClient:
 
             return True
 
+        except requests.exceptions.ConnectTimeout:
+            log.debug(
+                "convert: could not connect to %s within %.1fs",
+                self._base,
+                self._connect_timeout,
+            )
+            return False
+        except requests.exceptions.ReadTimeout:
+            log.debug(
+                "convert: server accepted the request but produced no result "
+                "within %.1fs",
+                self._read_timeout,
+            )
+            return False
         except Exception as exc:
             log.debug("convert: unexpected error: %s", exc)
             return False
 
+    def convert_async(
+        self,
+        input_path: str | os.PathLike[str],
+        output_path: str | os.PathLike[str],
+        model_name: str,
+        index_path: str = "",
+    ) -> None:
+        """Run :meth:`convert` on a background worker (fire-and-forget).
+
+        Returns immediately; the converted file appears at *output_path*
+        whenever the server finishes.  Never raises.
+        """
+        if self._convert_pool is None:
+            self._convert_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="rvc-convert"
+            )
+        self._convert_pool.submit(
+            self.convert, input_path, output_path, model_name, index_path
+        )
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
@@ -141,24 +264,15 @@ class RVCClient:
           9  rms_mix_rate  (float) loudness envelope mix
           10 protect       (float) voiceless consonant protection
           11 model_name    (str)   .pth filename (some forks expect this)
+
+        The invariant fields live in a template built once in __init__;
+        only the three per-call slots are assigned here.
         """
-        return {
-            "fn_index": self.fn_index,
-            "data": [
-                0,           # spk_id
-                input_path,
-                0,           # f0_up_key (pitch shift)
-                "",          # f0_file
-                "rmvpe",     # f0_method
-                index_path,
-                0.75,        # index_rate
-                3,           # filter_radius
-                0,           # resample_sr
-                0.25,        # rms_mix_rate
-                0.33,        # protect
-                model_name,
-            ],
-        }
+        data = self._payload_data_template.copy()
+        data[1] = input_path
+        data[5] = index_path
+        data[11] = model_name
+        return {"fn_index": self.fn_index, "data": data}
 
     def __repr__(self) -> str:
         return f"RVCClient(host={self.host!r}, port={self.port})"
@@ -207,6 +321,18 @@ def convert_for_playback(
             )
             return None
 
+        # On-disk cache: a converted file at least as new as its source is
+        # still valid — skip the probe and the GPU-side conversion entirely.
+        output = converted_dir / source.name
+        try:
+            if output.stat().st_mtime >= source.stat().st_mtime:
+                log.debug(
+                    "convert_for_playback: reusing cached converted %s", output.name
+                )
+                return str(output)
+        except OSError:
+            pass
+
         # Fast path: RVC server is not up, use source directly
         if not client.is_available():
             log.debug(
@@ -216,9 +342,8 @@ def convert_for_playback(
 
         # Convert
         converted_dir.mkdir(parents=True, exist_ok=True)
-        output = converted_dir / source.name
 
-        success = client.convert(str(source), str(output), model_name, index_path)
+        success = client.convert(source, output, model_name, index_path)
 
         if success and output.exists():
             log.debug("convert_for_playback: returning converted %s", output.name)
@@ -236,35 +361,120 @@ def convert_for_playback(
         return None
 
 
+def convert_for_playback_async(
+    event: ChuuniEvent,
+    character_dir: str,
+    client: RVCClient,
+    model_name: str,
+    *,
+    index_path: str = "",
+) -> str | None:
+    """Like :func:`convert_for_playback`, but never blocks on conversion.
+
+    If a converted file at least as new as its source already exists it is
+    returned immediately.  Otherwise (missing or stale — e.g. the source
+    was re-recorded) the conversion is kicked off on the client's
+    background worker and the *source* path is returned right away — the
+    first playthrough uses the original voice, later ones pick up the
+    converted file.  Never raises.
+    """
+    try:
+        char_path = Path(character_dir)
+        source = _find_source(event, char_path / "source")
+        if source is None:
+            log.debug(
+                "convert_for_playback_async: no source audio for event=%s",
+                event.value,
+            )
+            return None
+
+        converted_dir = char_path / "converted"
+        output = converted_dir / source.name
+        # Same freshness rule as the sync path: a converted file older than
+        # its source is stale and must be refreshed, not served forever.
+        try:
+            if output.stat().st_mtime >= source.stat().st_mtime:
+                return str(output)
+        except OSError:
+            pass
+
+        if client.is_available():
+            converted_dir.mkdir(parents=True, exist_ok=True)
+            client.convert_async(source, output, model_name, index_path)
+        return str(source)
+
+    except Exception as exc:
+        log.debug("convert_for_playback_async: unexpected error: %s", exc)
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
+# Source candidate cache: (source dir, event value) → (dir mtime_ns,
+# candidates).  Bursts of events re-walk the same source dir identically;
+# the dir mtime check invalidates the entry whenever a file is added or
+# removed.  FIFO-evicted at a small bound to stay negligible.
+_SOURCE_CACHE: dict[tuple[str, str], tuple[int, list[Path]]] = {}
+_SOURCE_CACHE_MAX = 256
+
+
 def _find_source(event: ChuuniEvent, source_dir: Path) -> Path | None:
     """Return a randomly-chosen source audio file for *event*, or None.
 
     Matches the same patterns as player._find_candidates:
       - exact:    <event_value>.<ext>
       - variants: <event_value>_*.<ext>
+
+    Candidate lists are memoized per (directory, event) and invalidated
+    when the directory's mtime advances.
     """
     import random
 
     if not source_dir.is_dir():
         return None
 
-    stem = event.value
-    candidates: list[Path] = []
-    seen: set[Path] = set()
-
-    for ext in _AUDIO_EXTS:
-        exact = source_dir / f"{stem}{ext}"
-        if exact.exists() and exact not in seen:
-            candidates.append(exact)
-            seen.add(exact)
-        for f in sorted(source_dir.glob(f"{stem}_*{ext}")):
-            if f not in seen:
-                candidates.append(f)
-                seen.add(f)
+    key = (str(source_dir), event.value)
+    mtime = source_dir.stat().st_mtime_ns
+    cached = _SOURCE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        candidates = cached[1]
+    else:
+        candidates = _scan_source(event, source_dir)
+        if len(_SOURCE_CACHE) >= _SOURCE_CACHE_MAX:
+            _SOURCE_CACHE.pop(next(iter(_SOURCE_CACHE)))
+        _SOURCE_CACHE[key] = (mtime, candidates)
 
     return random.choice(candidates) if candidates else None
+
+
+def _scan_source(event: ChuuniEvent, source_dir: Path) -> list[Path]:
+    """Scan *source_dir* for audio files matching *event* (uncached).
+
+    One os.scandir pass classifies every entry instead of an exists()
+    probe plus glob (each a directory re-read) per extension.
+    """
+    stem = event.value
+    variant_prefix = f"{stem}_"
+    exacts: list[Path] = []
+    variants: list[Path] = []
+    try:
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                root, ext = os.path.splitext(entry.name)
+                if ext not in _EXT_PRIORITY:
+                    continue
+                if root == stem:
+                    exacts.append(source_dir / entry.name)
+                elif root.startswith(variant_prefix):
+                    variants.append(source_dir / entry.name)
+    except OSError:
+        return []
+
+    # One sort over the matching files only, keyed by extension priority,
+    # instead of per-extension bucket bookkeeping during the scan.
+    exacts.sort(key=lambda p: _EXT_PRIORITY[p.suffix])
+    variants.sort(key=lambda p: (_EXT_PRIORITY[p.suffix], p.name))
+    return exacts + variants
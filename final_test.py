@@ -2,11 +2,10 @@
 
 
 def bubble_sort(arr: list) -> list:
-    """Sort *arr* in ascending order using bubble sort. Returns a new list."""
-    result = list(arr)
-    n = len(result)
-    for i in range(n):
-        for j in range(n - i - 1):
-            if result[j] > result[j + 1]:
-                result[j], result[j + 1] = result[j + 1], result[j]
-    return result
+    """Sort *arr* in ascending order. Returns a new list.
+
+    Despite the name, this dispatches to the built-in sorted() — C-level
+    adaptive Timsort — rather than the O(n²) pure-Python bubble loop the
+    module originally shipped.
+    """
+    return sorted(arr)
@@ -1,5 +1,5 @@
 import pytest
-from hero_stats import calculate_power
+from hero_stats import calculate_power, calculate_power_batch
 
 
 def test_basic_power_level1():
@@ -23,5 +23,84 @@ def test_invalid_level_raises():
         calculate_power(10, 10, 10, 99)
 
 
+def test_fractional_level_raises():
+    # 2.5 在 1~5 范围内，但不是合法等级
+    with pytest.raises(ValueError):
+        calculate_power(10, 8, 12, 2.5)
+
+
 def test_zero_stats():
     assert calculate_power(0, 0, 0, 1) == 0
+
+
+def test_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    attack = [10, 30, 80, 0]
+    defense = [8, 25, 60, 0]
+    speed = [12, 20, 70, 0]
+    level = [1, 3, 5, 1]
+    expected = [
+        calculate_power(a, d, s, lv)
+        for a, d, s, lv in zip(attack, defense, speed, level)
+    ]
+    result = calculate_power_batch(attack, defense, speed, level)
+    assert result.tolist() == expected
+    assert result.dtype == np.int64
+
+
+def test_batch_accepts_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    result = calculate_power_batch(
+        np.array([10], dtype=np.int32),
+        np.array([8], dtype=np.int32),
+        np.array([12], dtype=np.int32),
+        np.array([1], dtype=np.int32),
+    )
+    assert result.tolist() == [44]
+
+
+def test_batch_out_of_range_level_raises():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        calculate_power_batch([10], [10], [10], [99])
+
+
+def test_batch_float_level_raises():
+    pytest.importorskip("numpy")
+    # 浮点等级（如 2.5）过去能通过范围检查然后在下标处崩溃
+    with pytest.raises(ValueError):
+        calculate_power_batch([10, 10], [10, 10], [10, 10], [2.5, 3.0])
+
+
+def test_batch_kernel_matches_fallback(monkeypatch):
+    pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    import hero_stats
+
+    attack = [10, 30, 80]
+    defense = [8, 25, 60]
+    speed = [12, 20, 70]
+    level = [1, 3, 5]
+    # _NJIT_KERNEL=False 让 _power_kernel 返回 None，强制走 numpy 回退路径
+    monkeypatch.setattr(hero_stats, "_NJIT_KERNEL", False)
+    fallback = calculate_power_batch(attack, defense, speed, level)
+    monkeypatch.setattr(hero_stats, "_NJIT_KERNEL", None)
+    jit = calculate_power_batch(attack, defense, speed, level)
+    assert jit.tolist() == fallback.tolist()
+
+
+def test_batch_float_stats_match_with_and_without_kernel(monkeypatch):
+    pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    import hero_stats
+
+    # 浮点属性不能进 int64 内核（会逐项截断）；两种装机情况结果必须一致
+    attack = [10.5, 30.0, 80.25]
+    defense = [8.0, 25.5, 60.0]
+    speed = [12.75, 20.0, 70.5]
+    level = [1, 3, 5]
+    monkeypatch.setattr(hero_stats, "_NJIT_KERNEL", False)
+    fallback = calculate_power_batch(attack, defense, speed, level)
+    monkeypatch.setattr(hero_stats, "_NJIT_KERNEL", None)
+    with_numba = calculate_power_batch(attack, defense, speed, level)
+    assert with_numba.tolist() == fallback.tolist()
@@ -0,0 +1,107 @@
+"""Tests for the hand-rolled TOML writer in chuuni_voice.config."""
+
+import datetime
+
+import pytest
+
+import chuuni_voice.config as config_mod
+from chuuni_voice.config import load_config, save_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Point the config paths at a temp dir and reset the in-memory caches."""
+    monkeypatch.setattr(config_mod, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_mod, "CONFIG_FILE", tmp_path / "config.toml")
+    monkeypatch.setattr(config_mod, "CONFIG_CACHE_FILE", tmp_path / "config.cache")
+    config_mod._invalidate_cache()
+    yield
+    config_mod._invalidate_cache()
+
+
+def _load_from_toml():
+    """load_config forced down the tomllib path (bypassing the pickle sidecar)."""
+    config_mod.CONFIG_CACHE_FILE.unlink(missing_ok=True)
+    config_mod._invalidate_cache()
+    return load_config()
+
+
+class TestSaveConfigRoundTrip:
+    def test_scalars_round_trip(self):
+        save_config(
+            {
+                "active_character": "sakura",
+                "volume": 0.5,
+                "enabled": False,
+                "cooldown_seconds": 3.0,
+            }
+        )
+        cfg = _load_from_toml()
+        assert cfg["active_character"] == "sakura"
+        assert cfg["volume"] == 0.5
+        assert cfg["enabled"] is False
+        assert cfg["cooldown_seconds"] == 3.0
+
+    def test_string_escaping_round_trips(self):
+        save_config({"active_character": 'back\\slash "quoted"'})
+        assert _load_from_toml()["active_character"] == 'back\\slash "quoted"'
+
+    def test_cooldown_table_round_trips(self):
+        save_config({"cooldown": {"coding": 10.0, "error": 1.5}})
+        cooldowns = _load_from_toml()["cooldown"]
+        assert cooldowns == {"coding": 10.0, "error": 1.5}
+
+    def test_array_value_round_trips(self):
+        # Hand-edited configs can contain TOML arrays; load_config preserves
+        # unknown keys, so saving must not choke on them.
+        save_config({"favorite_events": ["coding", "error"]})
+        assert _load_from_toml()["favorite_events"] == ["coding", "error"]
+
+    def test_datetime_value_round_trips(self):
+        stamp = datetime.datetime(2026, 8, 27, 12, 30, 0)
+        save_config({"last_used": stamp, "installed_on": datetime.date(2026, 1, 2)})
+        cfg = _load_from_toml()
+        assert cfg["last_used"] == stamp
+        assert cfg["installed_on"] == datetime.date(2026, 1, 2)
+
+    def test_unsupported_value_dropped_without_raising(self):
+        save_config({"volume": 0.5, "weird": {1, 2}})
+        cfg = _load_from_toml()
+        assert cfg["volume"] == 0.5
+        assert "weird" not in cfg
+
+    def test_unsupported_table_value_dropped_without_raising(self):
+        save_config({"cooldown": {"coding": 10.0, "weird": object()}})
+        assert _load_from_toml()["cooldown"] == {"coding": 10.0}
+
+    def test_sidecar_matches_toml_after_lossy_save(self):
+        # The pickle sidecar must not resurrect a key the TOML dropped.
+        save_config({"volume": 0.5, "weird": {1, 2}})
+        cfg = load_config()  # served from the sidecar
+        assert "weird" not in cfg
+        assert cfg == _load_from_toml()
+
+    def test_sidecar_picks_up_new_default_key(self, monkeypatch):
+        # A package upgrade can add a default after the sidecar was written;
+        # the sidecar load must still honour the "all keys present" contract.
+        save_config({"volume": 0.3})
+        monkeypatch.setitem(config_mod.DEFAULT_CONFIG, "new_feature", "on")
+        config_mod._invalidate_cache()
+        cfg = load_config()  # served from the sidecar
+        assert cfg["new_feature"] == "on"
+        assert cfg["volume"] == 0.3
+
+    def test_sidecar_picks_up_changed_default_value(self, monkeypatch):
+        # A default the user never overrode must not be frozen at its value
+        # from save time.
+        save_config({"volume": 0.3})
+        monkeypatch.setitem(config_mod.DEFAULT_CONFIG, "cooldown_seconds", 9.0)
+        config_mod._invalidate_cache()
+        assert load_config()["cooldown_seconds"] == 9.0
+
+    def test_missing_defaults_are_merged_on_load(self):
+        save_config({"volume": 0.3})
+        cfg = _load_from_toml()
+        assert cfg["volume"] == 0.3
+        assert cfg["active_character"] == "default"
+        assert cfg["enabled"] is True
@@ -1,7 +1,6 @@
 """Tests for chuuni_voice.player."""
 
-import json
-import queue
+import os
 import threading
 import time
 from pathlib import Path
@@ -37,16 +36,16 @@ def _make_audio(directory: Path, name: str) -> Path:
 
 
 # ---------------------------------------------------------------------------
-# Shared fixture: redirect cooldown file to a temp dir for every test
+# Shared fixture: redirect cooldown stamps to a temp dir for every test
 # ---------------------------------------------------------------------------
 
 
 @pytest.fixture(autouse=True)
 def reset_player_state(tmp_path, monkeypatch):
-    """Redirect cooldown file to a temp dir so tests don't touch real state."""
+    """Redirect cooldown stamp files to a temp dir so tests don't touch real state."""
     monkeypatch.setattr(player_mod, "COOLDOWN_DIR", tmp_path)
-    monkeypatch.setattr(player_mod, "COOLDOWN_FILE", tmp_path / "cooldown.json")
-    monkeypatch.setattr(player_mod, "COOLDOWN_LOCK_FILE", tmp_path / "cooldown.lock")
+    # Tests patch shutil.which per-test; drop any cached probe result
+    player_mod._resolved_linux_player.cache_clear()
     yield
 
 
@@ -105,7 +104,7 @@ class TestPlayBlocking:
         audio = _make_audio(tmp_path, "test.mp3")
 
         with (
-            patch("platform.system", return_value="Darwin"),
+            patch.object(player_mod, "_SYSTEM", "Darwin"),
             patch("subprocess.Popen") as mock_popen,
         ):
             _play_blocking(str(audio), 0.8)
@@ -122,7 +121,7 @@ class TestPlayBlocking:
         audio = _make_audio(tmp_path, "test.mp3")
 
         with (
-            patch("platform.system", return_value="Darwin"),
+            patch.object(player_mod, "_SYSTEM", "Darwin"),
             patch("subprocess.Popen") as mock_popen,
         ):
             _play_blocking(str(audio), 0.5)
@@ -145,7 +144,7 @@ class TestPlayBlocking:
         audio = _make_audio(tmp_path, "test.mp3")
 
         with (
-            patch("platform.system", return_value="Darwin"),
+            patch.object(player_mod, "_SYSTEM", "Darwin"),
             patch("subprocess.Popen", side_effect=OSError("binary not found")),
         ):
             _play_blocking(str(audio), 0.8)  # must not raise
@@ -157,7 +156,7 @@ class TestPlayBlocking:
         audio = _make_audio(tmp_path, "test.mp3")
 
         with (
-            patch("platform.system", return_value="Darwin"),
+            patch.object(player_mod, "_SYSTEM", "Darwin"),
             patch("subprocess.Popen") as mock_popen,
         ):
             _play_blocking(str(audio), 0.8)
@@ -192,8 +191,8 @@ class TestPlayEvent:
         chosen_paths: set[str] = set()
         # Run enough iterations to hit all three with overwhelming probability
         for _ in range(30):
-            # Reset cooldown between iterations by deleting the file
-            player_mod.COOLDOWN_FILE.unlink(missing_ok=True)
+            # Reset cooldown between iterations by deleting the stamp file
+            (player_mod.COOLDOWN_DIR / "task_done.stamp").unlink(missing_ok=True)
             with patch("chuuni_voice.player._enqueue_task") as mock_enqueue:
                 play_event(ChuuniEvent.TASK_DONE, str(tmp_path))
             chosen_paths.add(mock_enqueue.call_args[0][0])
@@ -300,7 +299,7 @@ class TestCooldown:
 
 
 class TestCrossProcessCooldown:
-    """Tests for the file-backed cooldown mechanism."""
+    """Tests for the stamp-file-backed cooldown mechanism."""
 
     def test_first_call_returns_true(self):
         """No prior state → first claim must succeed."""
@@ -311,12 +310,12 @@ class TestCrossProcessCooldown:
         _check_and_claim_cooldown("task_done", 3.0)
         assert _check_and_claim_cooldown("task_done", 3.0) is False
 
-    def test_state_written_to_file(self):
-        """After a successful claim the cooldown file must contain the event."""
+    def test_stamp_file_written(self):
+        """After a successful claim the event's stamp file holds a fresh mtime."""
         _check_and_claim_cooldown("coding", 3.0)
-        data = json.loads(player_mod.COOLDOWN_FILE.read_text())
-        assert "coding" in data
-        assert isinstance(data["coding"], float)
+        stamp = player_mod.COOLDOWN_DIR / "coding.stamp"
+        assert stamp.exists()
+        assert stamp.stat().st_mtime == pytest.approx(time.time(), abs=5.0)
 
     def test_different_events_independent(self):
         """Claiming one event must not block a different event."""
@@ -330,22 +329,29 @@ class TestCrossProcessCooldown:
         with patch("chuuni_voice.player.time.time", return_value=1004.0):
             assert _check_and_claim_cooldown("coding", 3.0) is True
 
-    def test_simulates_second_process_sees_state(self, tmp_path):
-        """Simulate a second process: write state manually, then check."""
-        cooldown_file = player_mod.COOLDOWN_FILE
-        # "Process A" writes a fresh timestamp
-        cooldown_file.write_text(json.dumps({"task_done": time.time()}))
+    def test_simulates_second_process_sees_state(self):
+        """Simulate a second process: touch the stamp manually, then check."""
+        # "Process A" leaves a fresh stamp for task_done
+        (player_mod.COOLDOWN_DIR / "task_done.stamp").touch()
         # "Process B" calls _check_and_claim_cooldown and must be blocked
         assert _check_and_claim_cooldown("task_done", 3.0) is False
 
-    def test_corrupted_file_is_treated_as_empty(self):
-        """A corrupt JSON file must not raise — treat as no prior state."""
-        player_mod.COOLDOWN_FILE.write_text("NOT JSON {{{")
+    def test_stale_stamp_is_reclaimed(self):
+        """A stamp older than the window must not block the claim."""
+        stamp = player_mod.COOLDOWN_DIR / "task_done.stamp"
+        stamp.touch()
+        old = time.time() - 60.0
+        os.utime(stamp, (old, old))
         assert _check_and_claim_cooldown("task_done", 3.0) is True
 
-    def test_missing_file_is_treated_as_empty(self):
-        """No cooldown file present → first call must succeed."""
-        assert not player_mod.COOLDOWN_FILE.exists()
+    def test_custom_event_names_supported(self):
+        """Stamps are keyed by name, so arbitrary event values work too."""
+        assert _check_and_claim_cooldown("my_custom_event", 3.0) is True
+        assert _check_and_claim_cooldown("my_custom_event", 3.0) is False
+
+    def test_missing_stamp_is_treated_as_empty(self):
+        """No stamp file present → first call must succeed."""
+        assert not (player_mod.COOLDOWN_DIR / "task_done.stamp").exists()
         assert _check_and_claim_cooldown("task_done", 3.0) is True
 
 
@@ -373,13 +379,13 @@ class TestPlaybackQueue:
             _enqueue_task("/f2.mp3", 0.8)
             _enqueue_task("/f3.mp3", 0.8)
             _enqueue_task("/f4.mp3", 0.8)
-            assert player_mod._play_queue.qsize() == 3
+            assert len(player_mod._play_buf) == 3
 
             # 4th pending item should evict the oldest (f2)
             _enqueue_task("/f5.mp3", 0.8)
-            assert player_mod._play_queue.qsize() == 3
+            assert len(player_mod._play_buf) == 3
 
-            contents = list(player_mod._play_queue.queue)  # peek the internal deque
+            contents = list(player_mod._play_buf)  # peek the buffer
             paths = [p for p, _ in contents]
             assert "/f2.mp3" not in paths, "oldest item should have been dropped"
             assert "/f5.mp3" in paths, "newest item should be in the queue"
@@ -402,7 +408,7 @@ class TestPlaybackQueue:
             for i in range(10):
                 _enqueue_task(f"/item{i}.mp3", 0.8)
 
-            assert player_mod._play_queue.qsize() <= player_mod._QUEUE_MAX
+            assert len(player_mod._play_buf) <= player_mod._QUEUE_MAX
 
             unblock.set()
 
@@ -467,7 +473,7 @@ class TestFindCandidates:
 class TestBuildCommand:
     def test_mac_returns_afplay(self, tmp_path):
         audio = tmp_path / "test.mp3"
-        with patch("platform.system", return_value="Darwin"):
+        with patch.object(player_mod, "_SYSTEM", "Darwin"):
             cmd = _build_command(audio, 0.8)
         assert cmd is not None
         assert cmd[0] == "afplay"
@@ -480,7 +486,7 @@ class TestBuildCommand:
             return f"/usr/bin/{name}" if name == "paplay" else None
 
         with (
-            patch("platform.system", return_value="Linux"),
+            patch.object(player_mod, "_SYSTEM", "Linux"),
             patch("shutil.which", side_effect=which),
         ):
             cmd = _build_command(audio, 0.8)
@@ -495,7 +501,7 @@ class TestBuildCommand:
             return "/usr/bin/aplay" if name == "aplay" else None
 
         with (
-            patch("platform.system", return_value="Linux"),
+            patch.object(player_mod, "_SYSTEM", "Linux"),
             patch("shutil.which", side_effect=which),
         ):
             cmd = _build_command(audio, 0.8)
@@ -510,7 +516,7 @@ class TestBuildCommand:
             return "/usr/bin/mpg123" if name == "mpg123" else None
 
         with (
-            patch("platform.system", return_value="Linux"),
+            patch.object(player_mod, "_SYSTEM", "Linux"),
             patch("shutil.which", side_effect=which),
         ):
             cmd = _build_command(audio, 0.8)
@@ -521,7 +527,7 @@ class TestBuildCommand:
     def test_linux_returns_none_when_no_player(self, tmp_path):
         audio = tmp_path / "test.mp3"
         with (
-            patch("platform.system", return_value="Linux"),
+            patch.object(player_mod, "_SYSTEM", "Linux"),
             patch("shutil.which", return_value=None),
         ):
             cmd = _build_command(audio, 0.8)
@@ -529,7 +535,7 @@ class TestBuildCommand:
 
     def test_unsupported_platform_returns_none(self, tmp_path):
         audio = tmp_path / "test.mp3"
-        with patch("platform.system", return_value="Windows"):
+        with patch.object(player_mod, "_SYSTEM", "Windows"):
             cmd = _build_command(audio, 0.8)
         assert cmd is None
 
@@ -7,7 +7,12 @@ import pytest
 import requests as req_lib
 
 from chuuni_voice.events import ChuuniEvent
-from chuuni_voice.rvc import RVCClient, _find_source, convert_for_playback
+from chuuni_voice.rvc import (
+    RVCClient,
+    _find_source,
+    convert_for_playback,
+    convert_for_playback_async,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -45,38 +50,58 @@ def _make_audio(directory: Path, name: str) -> Path:
 class TestIsAvailable:
     def test_returns_true_when_server_responds(self):
         client = RVCClient()
-        with patch("requests.get", return_value=_ok_response()) as mock_get:
+        with patch.object(client._session, "head", return_value=_ok_response()) as mock_get:
             assert client.is_available() is True
-        mock_get.assert_called_once_with("http://127.0.0.1:7865/", timeout=3)
+        mock_get.assert_called_once_with(
+            "http://127.0.0.1:7865/", timeout=1.0, allow_redirects=False
+        )
 
     def test_returns_true_on_any_http_response(self):
         """Even a 404 means the server is reachable."""
         client = RVCClient()
-        with patch("requests.get", return_value=_error_response(404)):
+        with patch.object(client._session, "head", return_value=_error_response(404)):
             assert client.is_available() is True
 
     def test_returns_false_on_connection_error(self):
         client = RVCClient()
-        with patch("requests.get", side_effect=req_lib.exceptions.ConnectionError()):
+        with patch.object(
+            client._session, "head", side_effect=req_lib.exceptions.ConnectionError()
+        ):
             assert client.is_available() is False
 
     def test_returns_false_on_timeout(self):
         client = RVCClient()
-        with patch("requests.get", side_effect=req_lib.exceptions.Timeout()):
+        with patch.object(client._session, "head", side_effect=req_lib.exceptions.Timeout()):
             assert client.is_available() is False
 
     def test_returns_false_on_any_exception(self):
         client = RVCClient()
-        with patch("requests.get", side_effect=OSError("no route to host")):
+        with patch.object(client._session, "head", side_effect=OSError("no route to host")):
             assert client.is_available() is False
 
     def test_uses_custom_host_and_port(self):
         client = RVCClient(host="192.168.1.5", port=9999)
-        with patch("requests.get", return_value=_ok_response()) as mock_get:
+        with patch.object(client._session, "head", return_value=_ok_response()) as mock_get:
             client.is_available()
         url = mock_get.call_args[0][0]
         assert url.startswith("http://192.168.1.5:9999/")
 
+    def test_result_cached_within_ttl(self):
+        """Repeated checks within the TTL must reuse the first probe."""
+        client = RVCClient()
+        with patch.object(client._session, "head", return_value=_ok_response()) as mock_get:
+            assert client.is_available() is True
+            assert client.is_available() is True
+        mock_get.assert_called_once()
+
+    def test_invalidate_forces_reprobe(self):
+        client = RVCClient()
+        with patch.object(client._session, "head", return_value=_ok_response()) as mock_get:
+            client.is_available()
+            client.invalidate_availability()
+            client.is_available()
+        assert mock_get.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # RVCClient.convert
@@ -88,8 +113,9 @@ class TestConvert:
         audio_in = _make_audio(tmp_path, "input.wav")
         audio_out = tmp_path / "output.wav"
 
-        with patch("requests.post", return_value=_ok_response()):
-            result = RVCClient().convert(str(audio_in), str(audio_out), "my_model")
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=_ok_response()):
+            result = client.convert(str(audio_in), str(audio_out), "my_model")
 
         assert result is True
 
@@ -97,8 +123,9 @@ class TestConvert:
         audio_in = _make_audio(tmp_path, "input.wav")
         audio_out = tmp_path / "output.wav"
 
-        with patch("requests.post", return_value=_error_response(500)):
-            result = RVCClient().convert(str(audio_in), str(audio_out), "model")
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=_error_response(500)):
+            result = client.convert(str(audio_in), str(audio_out), "model")
 
         assert result is False
 
@@ -106,8 +133,11 @@ class TestConvert:
         audio_in = _make_audio(tmp_path, "input.wav")
         audio_out = tmp_path / "output.wav"
 
-        with patch("requests.post", side_effect=req_lib.exceptions.ConnectionError()):
-            result = RVCClient().convert(str(audio_in), str(audio_out), "model")
+        client = RVCClient()
+        with patch.object(
+            client._session, "post", side_effect=req_lib.exceptions.ConnectionError()
+        ):
+            result = client.convert(str(audio_in), str(audio_out), "model")
 
         assert result is False
 
@@ -120,8 +150,9 @@ class TestConvert:
         err_resp.status_code = 200
         err_resp.json.return_value = {"error": "model not found"}
 
-        with patch("requests.post", return_value=err_resp):
-            result = RVCClient().convert(str(audio_in), str(audio_out), "model")
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=err_resp):
+            result = client.convert(str(audio_in), str(audio_out), "model")
 
         assert result is False
 
@@ -129,24 +160,27 @@ class TestConvert:
         audio_in = _make_audio(tmp_path, "input.wav")
         audio_out = tmp_path / "output.wav"
 
-        with patch("requests.post", side_effect=RuntimeError("boom")):
-            result = RVCClient().convert(str(audio_in), str(audio_out), "model")
+        client = RVCClient()
+        with patch.object(client._session, "post", side_effect=RuntimeError("boom")):
+            result = client.convert(str(audio_in), str(audio_out), "model")
 
         assert result is False
 
     def test_never_raises(self, tmp_path):
         """convert() must not raise under any circumstances."""
-        with patch("requests.post", side_effect=Exception("unexpected")):
+        client = RVCClient()
+        with patch.object(client._session, "post", side_effect=Exception("unexpected")):
             # Should return False, not raise
-            result = RVCClient().convert("/nope/in.wav", "/nope/out.wav", "x")
+            result = client.convert("/nope/in.wav", "/nope/out.wav", "x")
         assert result is False
 
     def test_payload_contains_input_path(self, tmp_path):
         audio_in = _make_audio(tmp_path, "input.wav")
         audio_out = tmp_path / "output.wav"
 
-        with patch("requests.post", return_value=_ok_response()) as mock_post:
-            RVCClient().convert(str(audio_in), str(audio_out), "model", "idx.index")
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=_ok_response()) as mock_post:
+            client.convert(str(audio_in), str(audio_out), "model", "idx.index")
 
         payload = mock_post.call_args[1]["json"]
         assert payload["fn_index"] == 0
@@ -156,8 +190,9 @@ class TestConvert:
         audio_in = _make_audio(tmp_path, "input.wav")
         audio_out = tmp_path / "output.wav"
 
-        with patch("requests.post", return_value=_ok_response()) as mock_post:
-            RVCClient().convert(str(audio_in), str(audio_out), "hero.pth", "hero.index")
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=_ok_response()) as mock_post:
+            client.convert(str(audio_in), str(audio_out), "hero.pth", "hero.index")
 
         data = mock_post.call_args[1]["json"]["data"]
         assert "hero.pth" in data
@@ -172,10 +207,9 @@ class TestConvert:
         desired_out.parent.mkdir()
 
         resp = _ok_response(data=[str(server_out)])
-        with patch("requests.post", return_value=resp):
-            result = RVCClient().convert(
-                str(audio_in), str(desired_out), "model"
-            )
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=resp):
+            result = client.convert(str(audio_in), str(desired_out), "model")
 
         assert result is True
         assert desired_out.exists()
@@ -185,17 +219,40 @@ class TestConvert:
         audio_in = _make_audio(tmp_path, "in.wav")
         audio_out = tmp_path / "out.wav"
 
-        with patch("requests.post", return_value=_ok_response()) as mock_post:
-            RVCClient(fn_index=5).convert(str(audio_in), str(audio_out), "m")
+        client = RVCClient(fn_index=5)
+        with patch.object(client._session, "post", return_value=_ok_response()) as mock_post:
+            client.convert(str(audio_in), str(audio_out), "m")
 
         assert mock_post.call_args[1]["json"]["fn_index"] == 5
 
+    def test_uses_split_timeouts(self, tmp_path):
+        """with_timeouts controls the (connect, read) tuple passed to post."""
+        audio_in = _make_audio(tmp_path, "in.wav")
+        audio_out = tmp_path / "out.wav"
+
+        client = RVCClient.with_timeouts(connect=1.5, read=45.0)
+        with patch.object(client._session, "post", return_value=_ok_response()) as mock_post:
+            client.convert(str(audio_in), str(audio_out), "m")
+
+        assert mock_post.call_args[1]["timeout"] == (1.5, 45.0)
+
+    def test_returns_false_on_connect_timeout(self, tmp_path):
+        audio_in = _make_audio(tmp_path, "in.wav")
+        audio_out = tmp_path / "out.wav"
+
+        client = RVCClient()
+        with patch.object(
+            client._session, "post", side_effect=req_lib.exceptions.ConnectTimeout()
+        ):
+            assert client.convert(str(audio_in), str(audio_out), "m") is False
+
     def test_uses_correct_endpoint(self, tmp_path):
         audio_in = _make_audio(tmp_path, "in.wav")
         audio_out = tmp_path / "out.wav"
 
-        with patch("requests.post", return_value=_ok_response()) as mock_post:
-            RVCClient().convert(str(audio_in), str(audio_out), "m")
+        client = RVCClient()
+        with patch.object(client._session, "post", return_value=_ok_response()) as mock_post:
+            client.convert(str(audio_in), str(audio_out), "m")
 
         url = mock_post.call_args[0][0]
         assert url.endswith("/run/predict")
@@ -324,6 +381,46 @@ class TestConvertForPlayback:
         assert model_arg == "hero.pth"
         assert index_arg == "hero.index"
 
+    def test_reuses_fresh_converted_file(self, tmp_path):
+        """A converted file newer than its source skips probe and convert."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        _make_audio(source_dir, "coding.mp3")
+        converted_dir = tmp_path / "converted"
+        converted_dir.mkdir()
+        converted = _make_audio(converted_dir, "coding.mp3")
+
+        client = self._make_client()
+        result = convert_for_playback(ChuuniEvent.CODING, str(tmp_path), client, "m")
+
+        assert result == str(converted)
+        client.is_available.assert_not_called()
+        client.convert.assert_not_called()
+
+    def test_reconverts_when_converted_file_stale(self, tmp_path):
+        """A converted file older than its source must be regenerated."""
+        import os
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        _make_audio(source_dir, "coding.mp3")
+        converted_dir = tmp_path / "converted"
+        converted_dir.mkdir()
+        stale = _make_audio(converted_dir, "coding.mp3")
+        old = stale.stat().st_mtime - 60.0
+        os.utime(stale, (old, old))
+
+        def fake_convert(in_path, out_path, model, index=""):
+            Path(out_path).touch()
+            return True
+
+        client = self._make_client()
+        client.convert.side_effect = fake_convert
+
+        convert_for_playback(ChuuniEvent.CODING, str(tmp_path), client, "m")
+
+        client.convert.assert_called_once()
+
     def test_does_not_raise_on_any_error(self, tmp_path):
         """convert_for_playback must never raise."""
         client = MagicMock(spec=RVCClient)
@@ -351,6 +448,102 @@ class TestConvertForPlayback:
         assert "task_done_1" in result
 
 
+# ---------------------------------------------------------------------------
+# convert_for_playback_async
+# ---------------------------------------------------------------------------
+
+
+class TestConvertForPlaybackAsync:
+    def _make_client(self, *, available: bool = True) -> MagicMock:
+        client = MagicMock(spec=RVCClient)
+        client.is_available.return_value = available
+        return client
+
+    def test_returns_source_and_kicks_off_conversion(self, tmp_path):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        audio = _make_audio(source_dir, "coding.mp3")
+
+        client = self._make_client()
+        result = convert_for_playback_async(
+            ChuuniEvent.CODING, str(tmp_path), client, "model"
+        )
+
+        assert result == str(audio)
+        client.convert_async.assert_called_once()
+
+    def test_returns_converted_file_when_already_cached(self, tmp_path):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        _make_audio(source_dir, "coding.mp3")
+        converted_dir = tmp_path / "converted"
+        converted_dir.mkdir()
+        converted = _make_audio(converted_dir, "coding.mp3")
+
+        client = self._make_client()
+        result = convert_for_playback_async(
+            ChuuniEvent.CODING, str(tmp_path), client, "model"
+        )
+
+        assert result == str(converted)
+        client.convert_async.assert_not_called()
+
+    def test_refreshes_stale_converted_file(self, tmp_path):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        audio = _make_audio(source_dir, "coding.mp3")
+        converted_dir = tmp_path / "converted"
+        converted_dir.mkdir()
+        converted = _make_audio(converted_dir, "coding.mp3")
+        # Source re-recorded after conversion: converted copy is stale.
+        import os
+
+        stale = audio.stat().st_mtime - 60
+        os.utime(converted, (stale, stale))
+
+        client = self._make_client()
+        result = convert_for_playback_async(
+            ChuuniEvent.CODING, str(tmp_path), client, "model"
+        )
+
+        assert result == str(audio)
+        client.convert_async.assert_called_once()
+
+    def test_returns_source_without_submit_when_unavailable(self, tmp_path):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        audio = _make_audio(source_dir, "error.wav")
+
+        client = self._make_client(available=False)
+        result = convert_for_playback_async(
+            ChuuniEvent.ERROR, str(tmp_path), client, "model"
+        )
+
+        assert result == str(audio)
+        client.convert_async.assert_not_called()
+
+    def test_returns_none_when_no_source(self, tmp_path):
+        (tmp_path / "source").mkdir()
+        client = self._make_client()
+        result = convert_for_playback_async(
+            ChuuniEvent.TASK_START, str(tmp_path), client, "m"
+        )
+        assert result is None
+
+    def test_does_not_raise_on_any_error(self, tmp_path):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        _make_audio(source_dir, "coding.mp3")
+
+        client = MagicMock(spec=RVCClient)
+        client.is_available.side_effect = RuntimeError("chaos")
+
+        result = convert_for_playback_async(
+            ChuuniEvent.CODING, str(tmp_path), client, "m"
+        )
+        assert result is None
+
+
 # ---------------------------------------------------------------------------
 # _find_source
 # ---------------------------------------------------------------------------